@@ -0,0 +1,85 @@
+#pragma once
+
+#include "Audio/RingBuffer.h"
+#include <atomic>
+#include <condition_variable>
+#include <memory>
+#include <mutex>
+#include <ostream>
+#include <thread>
+#include <type_traits>
+#include <vector>
+
+namespace DubSiren {
+
+/**
+ * Log record posted from a real-time thread.
+ *
+ * Producers fill in raw values only; the text is produced later on the
+ * logger thread by the formatter the producer supplies, so posting is a
+ * fixed-size copy with no allocation, formatting or I/O.
+ */
+struct LogEvent {
+    using Formatter = void (*)(std::ostream& os, const LogEvent& event);
+
+    Formatter format = nullptr;
+    const char* text = nullptr;  // Must point to storage that outlives the logger
+    bool isError = false;        // Written to stderr instead of stdout
+    int code = 0;
+    float values[3] = {0.0f, 0.0f, 0.0f};
+};
+
+static_assert(std::is_trivially_copyable<LogEvent>::value,
+              "LogEvent is copied through a memcpy ring buffer");
+
+/**
+ * Asynchronous logger for real-time threads.
+ *
+ * Each producer thread gets its own lock-free SPSC queue (identified by
+ * index), and a background thread drains all queues to stdout/stderr. post()
+ * never blocks: if a queue is full the event is dropped and counted.
+ */
+class AsyncLogger {
+public:
+    /**
+     * @param numProducers Number of producer threads (one queue each)
+     * @param capacity Events buffered per producer
+     */
+    explicit AsyncLogger(int numProducers, size_t capacity = 64);
+    ~AsyncLogger();
+
+    // Non-copyable
+    AsyncLogger(const AsyncLogger&) = delete;
+    AsyncLogger& operator=(const AsyncLogger&) = delete;
+
+    void start();
+
+    /**
+     * Stop the drain thread after flushing anything still queued.
+     */
+    void stop();
+
+    /**
+     * Queue an event. Real-time safe; only the thread that owns the given
+     * producer index may call this for it.
+     * @return false if the queue was full and the event was dropped
+     */
+    bool post(int producer, const LogEvent& event);
+
+    uint64_t getDropped() const { return dropped.load(std::memory_order_relaxed); }
+
+private:
+    std::vector<std::unique_ptr<RingBuffer<LogEvent>>> queues;
+    std::atomic<bool> running;
+    std::atomic<uint64_t> dropped;
+    std::thread drainThread;
+    
+    // Lets stop() cut the drain thread's sleep short; producers never touch it
+    std::mutex wakeMutex;
+    std::condition_variable wakeCv;
+
+    void drainLoop();
+    void drain();
+};
+
+} // namespace DubSiren
@@ -35,6 +35,18 @@ public:
      */
     void process(float* output, int numFrames);
     
+    /**
+     * Generate mono samples with master volume applied.
+     * Peaks are soft-limited to +/-1 but not otherwise sanitized; callers
+     * that convert to a fixed-point format are expected to handle NaN/Inf
+     * and clip in their own pass.
+     * Requests larger than the engine's buffer size are rendered in
+     * buffer-sized chunks.
+     * @param output Buffer to fill with numFrames mono samples
+     * @param numFrames Number of frames
+     */
+    void processMono(float* output, int numFrames);
+    
     /**
      * Trigger the siren sound.
      */
@@ -119,6 +131,26 @@ private:
     AudioParameter<float> lfoPitchDepth;  // LFO pitch modulation depth
     AudioParameter<PitchEnvelopeMode> pitchEnvMode;
     
+    // Parameters that live inside the DSP objects. The audio thread reads
+    // those objects without locking, so the setters only store the value
+    // here and flag it in pendingParams; renderBlock hands every flagged
+    // value to its DSP object at the start of the next block.
+    AudioParameter<Waveform> waveform;
+    AudioParameter<float> attackTime;
+    AudioParameter<float> releaseTime;
+    AudioParameter<float> lfoRate;
+    AudioParameter<float> lfoDepth;
+    AudioParameter<Waveform> lfoWaveform;
+    AudioParameter<float> filterCutoff;
+    AudioParameter<float> filterResonance;
+    AudioParameter<float> delayTime;
+    AudioParameter<float> delayFeedback;
+    AudioParameter<float> delayMix;
+    AudioParameter<float> reverbSize;
+    AudioParameter<float> reverbMix;
+    AudioParameter<float> reverbDamping;
+    std::atomic<uint32_t> pendingParams{0};
+    
     // Internal state
     float currentFrequency;
     SmoothedValue frequencySmooth;
@@ -127,15 +159,26 @@ private:
     bool inReleasePhase;
     float pitchEnvStartLevel;  // Envelope level when release started
     
-    // Temporary buffers (pre-allocated to avoid allocation in audio thread)
-    std::vector<float> oscBuffer;
-    std::vector<float> envBuffer;
-    std::vector<float> lfoBuffer;
-    std::vector<float> filterBuffer;
-    std::vector<float> delayBuffer;
+    // Temporary buffers, carved out of a single allocation made here in
+    // the constructor (never on the audio thread). Each lane is bufferSize
+    // floats rounded up to whole cache lines and starts on a line boundary,
+    // so the render pass walks one contiguous block instead of four heap
+    // chunks scattered between unrelated allocations.
+    static constexpr int NUM_SCRATCH_LANES = 4;
+    std::vector<float> scratch;
+    float* envBuffer = nullptr;
+    float* lfoBuffer = nullptr;
+    float* filterBuffer = nullptr;
+    float* delayBuffer = nullptr;
     
     // Mutex for trigger/release operations
     std::mutex triggerMutex;
+    
+    // Render at most bufferSize frames
+    void renderBlock(float* output, int numFrames);
+    
+    // Apply parameter changes queued by the setters (audio thread)
+    void applyPendingParameters();
 };
 
 } // namespace DubSiren
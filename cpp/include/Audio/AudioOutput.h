@@ -2,16 +2,28 @@
 
 #include "Common.h"
 #include "Audio/AudioEngine.h"
+#include "Audio/RingBuffer.h"
+#include "AsyncLogger.h"
+#include "Realtime.h"
 #include <thread>
 #include <atomic>
 #include <memory>
 #include <string>
+#include <vector>
 
 namespace DubSiren {
 
 /**
  * ALSA audio output handler.
  * Manages real-time audio streaming to the PCM5102 I2S DAC.
+ *
+ * Rendering and device writes run on separate threads: the render thread
+ * runs the engine and pushes finished S16 blocks into a lock-free ring,
+ * and the ALSA thread only copies blocks out of the ring into the device.
+ * A render stall therefore costs ring headroom rather than an underrun.
+ * The render thread works in batches of RENDER_BATCH blocks to amortize
+ * per-call engine overhead, while the device still sees bufferSize
+ * periods.
  */
 class AudioOutput {
 public:
@@ -27,6 +39,24 @@ public:
     AudioOutput(const AudioOutput&) = delete;
     AudioOutput& operator=(const AudioOutput&) = delete;
     
+    /**
+     * Override the ALSA writer thread's SCHED_FIFO priority (the render
+     * thread keeps its default distance below it). Call before start().
+     */
+    void setRealtimePriority(int priority) { audioPriority = priority; }
+    
+    /**
+     * Number of hardware periods (each bufferSize frames) in the device
+     * buffer; 0 (default) sizes the buffer to ~50 ms. Call before start().
+     */
+    void setPeriods(int count) { periods = count; }
+    
+    /**
+     * Pin the ALSA writer and render threads to one CPU (ideally an
+     * isolated core). Call before start(); negative leaves them unpinned.
+     */
+    void setAudioCore(int cpu) { audioCore = cpu; }
+    
     /**
      * Start audio output stream.
      * @return true if started successfully
@@ -43,12 +73,20 @@ public:
      */
     bool isRunning() const { return running.load(); }
     
+    /**
+     * Number of blocks the render thread asks the engine for per call.
+     * Size the engine's buffers to bufferSize * RENDER_BATCH so a batch
+     * is rendered in one pass.
+     */
+    static constexpr int RENDER_BATCH = 2;
+    
     /**
      * Get audio statistics.
      */
     struct Stats {
         uint64_t totalBuffers;
         uint64_t underruns;
+        uint64_t nanBuffers;  // Buffers that contained NaN/Inf samples
         float cpuUsage;  // Estimated CPU usage percentage
     };
     Stats getStats() const;
@@ -59,16 +97,36 @@ private:
     int bufferSize;
     int channels;
     std::string deviceName;
+    int audioPriority = AUDIO_THREAD_PRIORITY;
+    int periods = 0;
+    int audioCore = -1;
     
     std::atomic<bool> running;
     std::thread audioThread;
+    std::thread renderThread;
+    
+    // Rendered S16 blocks waiting for the ALSA thread
+    static constexpr int RING_BLOCKS = 2 * RENDER_BATCH;
+    RingBuffer<int16_t> ring;
+    
+    // Scratch buffers (allocated once, reused by their owning thread)
+    std::vector<float> monoBuffer;     // Render thread: one batch of mono samples
+    std::vector<int16_t> renderBuffer; // Render thread: one batch of S16 frames
+    std::vector<int16_t> intBuffer;    // ALSA thread: block being written
+    
+    // Log output from the ALSA and render threads (one queue each)
+    enum LogProducer { LOG_AUDIO = 0, LOG_RENDER = 1, NUM_LOG_PRODUCERS };
+    AsyncLogger logger;
     
-    // Statistics
+    // Statistics (single writer each: totalBuffers/underruns on the ALSA
+    // thread, nanBuffers/lastCpuUsage on the render thread)
     std::atomic<uint64_t> totalBuffers;
     std::atomic<uint64_t> underruns;
+    std::atomic<uint64_t> nanBuffers;
     std::atomic<float> lastCpuUsage;
     
     void audioLoop();
+    void renderLoop();
 };
 
 /**
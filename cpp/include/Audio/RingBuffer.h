@@ -0,0 +1,97 @@
+#pragma once
+
+#include "Common.h"
+#include <atomic>
+#include <cstddef>
+#include <cstring>
+#include <vector>
+
+namespace DubSiren {
+
+/**
+ * Lock-free single-producer / single-consumer ring buffer.
+ *
+ * Used to hand rendered audio from the render thread to the ALSA writer
+ * thread without locks. Capacity is rounded up to a power of two so
+ * index wrapping is a mask. Exactly one thread may call write() and
+ * exactly one (other) thread may call read().
+ */
+template<typename T>
+class RingBuffer {
+public:
+    explicit RingBuffer(size_t minCapacity)
+        : capacity(roundUpPow2(minCapacity))
+        , mask(capacity - 1)
+        , storage(capacity)
+        , head(0)
+        , tail(0)
+    {
+    }
+
+    // Non-copyable
+    RingBuffer(const RingBuffer&) = delete;
+    RingBuffer& operator=(const RingBuffer&) = delete;
+
+    /**
+     * Append count items. Producer thread only.
+     * @return false (and writes nothing) if there is not enough space
+     */
+    bool write(const T* data, size_t count) {
+        size_t h = head.load(std::memory_order_relaxed);
+        size_t t = tail.load(std::memory_order_acquire);
+        if (capacity - (h - t) < count) {
+            return false;
+        }
+        copyIn(h & mask, data, count);
+        head.store(h + count, std::memory_order_release);
+        return true;
+    }
+
+    /**
+     * Remove count items. Consumer thread only.
+     * @return false (and reads nothing) if fewer than count items are queued
+     */
+    bool read(T* data, size_t count) {
+        size_t t = tail.load(std::memory_order_relaxed);
+        size_t h = head.load(std::memory_order_acquire);
+        if (h - t < count) {
+            return false;
+        }
+        copyOut(t & mask, data, count);
+        tail.store(t + count, std::memory_order_release);
+        return true;
+    }
+
+    size_t availableToRead() const {
+        return head.load(std::memory_order_acquire) - tail.load(std::memory_order_acquire);
+    }
+
+    size_t availableToWrite() const {
+        return capacity - availableToRead();
+    }
+
+    size_t getCapacity() const { return capacity; }
+
+private:
+    void copyIn(size_t start, const T* data, size_t count) {
+        size_t first = std::min(count, capacity - start);
+        std::memcpy(&storage[start], data, first * sizeof(T));
+        std::memcpy(&storage[0], data + first, (count - first) * sizeof(T));
+    }
+
+    void copyOut(size_t start, T* data, size_t count) {
+        size_t first = std::min(count, capacity - start);
+        std::memcpy(data, &storage[start], first * sizeof(T));
+        std::memcpy(data + first, &storage[0], (count - first) * sizeof(T));
+    }
+
+    const size_t capacity;
+    const size_t mask;
+    std::vector<T> storage;
+
+    // Producer and consumer indices on separate cache lines
+    alignas(64) std::atomic<size_t> head;
+    alignas(64) std::atomic<size_t> tail;
+};
+
+} // namespace DubSiren
@@ -2,6 +2,7 @@
 
 #include <cmath>
 #include <cstdint>
+#include <cstring>
 #include <algorithm>
 #include <array>
 #include <vector>
@@ -27,6 +28,9 @@ enum class Waveform {
     Triangle = 3
 };
 
+constexpr int NUM_WAVEFORMS = 4;
+constexpr const char* WAVEFORM_NAMES[NUM_WAVEFORMS] = {"Sine", "Square", "Saw", "Triangle"};
+
 // Pitch envelope modes
 enum class PitchEnvelopeMode {
     None = 0,
@@ -45,6 +49,20 @@ inline float clampSample(float value) {
     return value;
 }
 
+// Finite check that survives -ffast-math (std::isfinite may be folded away)
+inline bool isFiniteSample(float value) {
+    uint32_t bits;
+    std::memcpy(&bits, &value, sizeof(bits));
+    return (bits & 0x7F800000u) != 0x7F800000u;
+}
+
+// Smallest power of two >= n (ring buffers index with & (size - 1))
+inline size_t roundUpPow2(size_t n) {
+    size_t p = 1;
+    while (p < n) p <<= 1;
+    return p;
+}
+
 // Linear interpolation
 inline float lerp(float a, float b, float t) {
     return a + t * (b - a);
@@ -56,6 +74,19 @@ inline float fastTanh(float x) {
     return x * (27.0f + x2) / (27.0f + 9.0f * x2);
 }
 
+// Output soft limiter: unity gain up to the knee, then rounds off toward
+// +/-1 (fastTanh reaches exactly 1 at 3, so the input to it is capped there)
+constexpr float SOFT_LIMIT_KNEE = 0.8f;
+
+inline float softLimit(float x) {
+    float magnitude = std::abs(x);
+    if (magnitude <= SOFT_LIMIT_KNEE) {
+        return x;
+    }
+    float over = std::min((magnitude - SOFT_LIMIT_KNEE) * (1.0f / (1.0f - SOFT_LIMIT_KNEE)), 3.0f);
+    return std::copysign(SOFT_LIMIT_KNEE + (1.0f - SOFT_LIMIT_KNEE) * fastTanh(over), x);
+}
+
 // Convert frequency to angular velocity
 inline float freqToOmega(float freq, float sampleRate) {
     return TWO_PI * freq / sampleRate;
@@ -45,7 +45,8 @@ public:
 private:
     int sampleRate;
     int maxDelaySamples;
-    std::vector<float> buffer;
+    std::vector<float> buffer;  // Power-of-two length >= maxDelaySamples
+    uint32_t bufferMask;        // buffer.size() - 1: index & bufferMask wraps
     int writePos;
     
     // Core parameters
@@ -61,6 +62,8 @@ private:
     // Feedback filters
     float filterHpFreq;
     float filterLpFreq;
+    float hpCoeff;  // One-pole coefficients for the above, computed once
+    float lpCoeff;
     float hpState;
     float lpState;
     
@@ -79,8 +82,9 @@ private:
     
     // Internal methods
     float calculateSlewRate() const;
+    float onePoleCoeff(float cutoffHz) const;
     float processFeedbackFilters(float sample);
-    float lerpRead(float delaySamples) const;
+    float lerpRead(int writeIndex, float delaySamples) const;
 };
 
 } // namespace DubSiren
@@ -37,6 +37,7 @@ public:
     
 private:
     int sampleRate;
+    float invSampleRate;  // 1 / sampleRate, so phase steps multiply
     float frequency;  // LFO rate in Hz
     float phase;      // Phase accumulator
     Waveform waveform;
@@ -40,6 +40,7 @@ public:
     
 private:
     int sampleRate;
+    float invSampleRate;  // 1 / sampleRate, so phase steps multiply
     float frequency;
     float phase;  // Phase accumulator (0.0 to 1.0)
     Waveform waveform;
@@ -49,8 +50,8 @@ private:
     
     // Waveform generators
     float generateSine();
-    float generateSquarePolyBlep();
-    float generateSawPolyBlep();
+    float generateSquarePolyBlep(float dt);
+    float generateSawPolyBlep(float dt);
     float generateTriangle();
 };
 
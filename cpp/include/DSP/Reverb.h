@@ -20,13 +20,17 @@ class ReverbEffect {
 public:
     explicit ReverbEffect(int sampleRate = DEFAULT_SAMPLE_RATE);
 
+    // Non-copyable (the delay lines point into lineMemory)
+    ReverbEffect(const ReverbEffect&) = delete;
+    ReverbEffect& operator=(const ReverbEffect&) = delete;
+
     void process(const float* input, float* output, int numSamples);
 
     // Parameters (same interface as before)
     void setSize(float size);      // Spring decay time (0.0 - 1.0)
     void setDryWet(float mix);     // Dry/wet mix (0.0 - 1.0)
     void setDamping(float damp);   // High-frequency damping (0.0 - 1.0)
-    void setWidth(float width);    // Stereo width (0.0 - 1.0)
+    void setWidth(float width);    // Stereo width (0.0 - 1.0); no effect on the mono output
 
     float getSize() const { return springDecay; }
     float getDryWet() const { return wet; }
@@ -59,13 +63,14 @@ private:
         void setLowpass(float freq, float q, float sampleRate);
         void setBandpass(float freq, float q, float sampleRate);
         void setHighpass(float freq, float q, float sampleRate);
+        void copyCoefficients(const Biquad& other);
         float process(float input);
         void reset();
     };
 
     // Spring line with dispersive delay and modal resonances
     struct SpringLine {
-        std::vector<float> delayBuffer;
+        float* delayBuffer;
         int delayLength;
         int writeIndex;
 
@@ -82,19 +87,19 @@ private:
 
         float feedback;
 
-        SpringLine() : delayLength(0), writeIndex(0), feedback(0.0f) {}
-        void init(int length, float sampleRate, int springIndex);
+        SpringLine() : delayBuffer(nullptr), delayLength(0), writeIndex(0), feedback(0.0f) {}
+        void init(float* buffer, int length, float sampleRate, int springIndex);
         float process(float input);
     };
 
     // Allpass filter for diffusion
     struct AllpassFilter {
-        std::vector<float> buffer;
+        float* buffer;
         int bufferSize;
         int index;
 
-        AllpassFilter() : bufferSize(0), index(0) {}
-        void init(int size);
+        AllpassFilter() : buffer(nullptr), bufferSize(0), index(0) {}
+        void init(float* storage, int size);
         float process(float input);
     };
 
@@ -103,6 +108,11 @@ private:
     Biquad outputLowcut;      // Highpass ~80Hz
     Biquad outputHighcut;     // Lowpass ~6kHz
 
+    // Storage for every spring and allpass delay line: one allocation,
+    // carved up in the constructor, so the per-sample walk over all lines
+    // stays within one contiguous block
+    std::vector<float> lineMemory;
+
     // Spring lines (stereo)
     std::array<SpringLine, NUM_SPRINGS> springsL;
     std::array<SpringLine, NUM_SPRINGS> springsR;
@@ -126,7 +136,10 @@ private:
         return x - (x * x * x) / 3.0f;
     }
 
-    void updateCoefficients();
+    // Coefficient updates, one per parameter so a setter only recomputes
+    // what depends on it
+    void updateFeedback();
+    void updateDamping();
 
     // Stereo spread
     static constexpr int STEREO_SPREAD = 47;
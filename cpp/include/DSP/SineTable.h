@@ -0,0 +1,46 @@
+#pragma once
+
+#include "Common.h"
+#include <array>
+#include <cmath>
+
+namespace DubSiren {
+
+/**
+ * One-cycle sine lookup with linear interpolation.
+ * 
+ * Replaces std::sin in per-sample oscillator and modulation code with two
+ * loads and a multiply-add. With 4096 points the interpolation error is
+ * below 3e-7, far under 16-bit output resolution.
+ */
+class SineTable {
+public:
+    static constexpr int SIZE = 4096;  // Power of two, so indices wrap with a mask
+    
+    SineTable() {
+        for (int i = 0; i <= SIZE; ++i) {
+            table[i] = static_cast<float>(std::sin(2.0 * 3.14159265358979323846 * i / SIZE));
+        }
+    }
+    
+    /**
+     * sin(2 * pi * phase).
+     * @param phase Position in cycles; any non-negative value (whole cycles wrap)
+     */
+    float operator()(float phase) const {
+        float position = phase * static_cast<float>(SIZE);
+        int index = static_cast<int>(position);
+        float frac = position - static_cast<float>(index);
+        index &= SIZE - 1;
+        return table[index] + (table[index + 1] - table[index]) * frac;
+    }
+    
+private:
+    std::array<float, SIZE + 1> table;  // Extra guard point: table[SIZE] == table[0]
+};
+
+// Shared table, built once during static initialization (before any audio
+// thread starts)
+inline const SineTable SINE_TABLE;
+
+} // namespace DubSiren
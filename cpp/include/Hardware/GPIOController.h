@@ -3,15 +3,17 @@
 #include "Common.h"
 #include "Audio/AudioEngine.h"
 #include "Hardware/LEDController.h"
+#include "AsyncLogger.h"
+#include "Realtime.h"
 #include <functional>
 #include <thread>
 #include <atomic>
 #include <array>
-#include <map>
 #include <mutex>
 #include <memory>
-#include <vector>
 #include <chrono>
+#include <condition_variable>
+#include <deque>
 
 namespace DubSiren {
 
@@ -32,6 +34,15 @@ namespace GPIO {
     constexpr int ENCODER_5_CLK = 14;
     constexpr int ENCODER_5_DT = 13;
     
+    // CLK/DT pairs in encoder order (encoder i drives BANK_PARAMS[bank][i])
+    constexpr int ENCODER_PINS[5][2] = {
+        {ENCODER_1_CLK, ENCODER_1_DT},
+        {ENCODER_2_CLK, ENCODER_2_DT},
+        {ENCODER_3_CLK, ENCODER_3_DT},
+        {ENCODER_4_CLK, ENCODER_4_DT},
+        {ENCODER_5_CLK, ENCODER_5_DT}
+    };
+    
     // Button pins
     constexpr int TRIGGER_BTN = 4;
     constexpr int SHIFT_BTN = 15;
@@ -53,33 +64,66 @@ enum class Bank {
     B   // Shift held
 };
 
+/**
+ * Quadrature decoder state machine.
+ *
+ * Pure state - no pin I/O, locking or allocation - so it can be fed from
+ * any input path (polling thread, edge-event thread, interrupt callback).
+ */
+class QuadratureDecoder {
+public:
+    /**
+     * Set the resting state without reporting a step.
+     */
+    void reset(int clk, int dt);
+    
+    /**
+     * Feed one pin sample.
+     * @return +1 or -1 when a step completes, otherwise 0
+     */
+    int update(int clk, int dt);
+    
+    int getState() const { return lastState; }
+    
+private:
+    int lastState = 3;     // (CLK << 1) | DT from the previous sample
+    int pendingSteps = 0;  // Valid transitions not yet reported as a step
+};
+
 /**
  * Rotary encoder handler with quadrature decoding.
+ *
+ * Input devices own no threads and do no pin I/O: the controller's single
+ * input thread reads all levels at once and hands the word to poll() when
+ * one of the device's lines has an edge (libgpiod edge events or pigpio
+ * alerts).
  */
 class RotaryEncoder {
 public:
-    using Callback = std::function<void(int direction)>;
-    
-    RotaryEncoder(int clkPin, int dtPin, Callback callback);
-    ~RotaryEncoder();
+    RotaryEncoder(int clkPin, int dtPin);
     
+    /**
+     * Configure the pins and sample the resting state.
+     */
     void start();
-    void stop();
     int getPosition() const { return position.load(); }
     
+    /**
+     * Decode this encoder's two bits of the level word.
+     * @param levels Pin levels, one bit per BCM pin (1 = high)
+     * @return +1 or -1 when a step completes, otherwise 0
+     */
+    int poll(uint32_t levels);
+    
+    /** Bit per BCM pin this device reads */
+    uint32_t getPinMask() const { return (1u << clkPin) | (1u << dtPin); }
+    
 private:
     int clkPin;
     int dtPin;
-    Callback callback;
     std::atomic<int> position;
-    std::atomic<bool> running;
-    std::thread pollThread;
     
-    int lastClk;
-    int lastDt;
-    
-    void pollLoop();
-    void update();
+    QuadratureDecoder decoder;
 };
 
 /**
@@ -91,28 +135,38 @@ public:
     using ReleaseCallback = std::function<void()>;
     
     MomentarySwitch(int pin, PressCallback onPress = nullptr, ReleaseCallback onRelease = nullptr);
-    ~MomentarySwitch();
     
+    /**
+     * Configure the pin and sample its initial level.
+     */
     void start();
-    void stop();
     bool isPressed() const { return pressed.load(); }
     
+    /**
+     * Run the debounce state machine on this switch's bit of the level word.
+     * @param levels Pin levels, one bit per BCM pin (1 = high)
+     * @return true while a change is still settling and needs another poll
+     */
+    bool poll(uint32_t levels);
+    
+    /** Bit per BCM pin this device reads */
+    uint32_t getPinMask() const { return 1u << pin; }
+    
 private:
     int pin;
     PressCallback pressCallback;
     ReleaseCallback releaseCallback;
     std::atomic<bool> pressed;
-    std::atomic<bool> running;
-    std::thread pollThread;
     
     int lastState;
+    int lastLoggedState;
     std::chrono::steady_clock::time_point lastChange;
     std::chrono::steady_clock::time_point lastPressTime;
     
-    static constexpr int DEBOUNCE_MS = 10;
-    static constexpr int MIN_PRESS_MS = 30;
-    
-    void pollLoop();
+    // Compared against raw steady_clock differences (integer ticks, no
+    // conversion per poll)
+    static constexpr std::chrono::milliseconds DEBOUNCE_TIME{10};
+    static constexpr std::chrono::milliseconds MIN_PRESS_TIME{30};
 };
 
 /**
@@ -130,27 +184,35 @@ public:
     using PositionCallback = std::function<void(SwitchPosition)>;
     
     ThreePositionSwitch(int upPin, int downPin, PositionCallback onChange = nullptr);
-    ~ThreePositionSwitch();
     
+    /**
+     * Configure the pins and read the initial position.
+     */
     void start();
-    void stop();
     SwitchPosition getPosition() const { return position.load(); }
     
+    /**
+     * Run the debounce state machine on this switch's bits of the level word.
+     * @param levels Pin levels, one bit per BCM pin (1 = high)
+     * @return true while a change is still settling and needs another poll
+     */
+    bool poll(uint32_t levels);
+    
+    /** Bit per BCM pin this device reads */
+    uint32_t getPinMask() const { return (1u << upPin) | (1u << downPin); }
+    
 private:
     int upPin;
     int downPin;
     PositionCallback callback;
     std::atomic<SwitchPosition> position;
-    std::atomic<bool> running;
-    std::thread pollThread;
     
     SwitchPosition lastPosition;
     std::chrono::steady_clock::time_point lastChange;
     
-    static constexpr int DEBOUNCE_MS = 20;
+    static constexpr std::chrono::milliseconds DEBOUNCE_TIME{20};
     
-    void pollLoop();
-    SwitchPosition readPosition();
+    SwitchPosition readPosition(uint32_t levels);
 };
 
 /**
@@ -185,6 +247,17 @@ public:
     GPIOController(AudioEngine& engine, ShutdownCallback shutdownCb = nullptr);
     ~GPIOController();
     
+    /**
+     * Pin the input thread to one CPU (ideally an isolated core). Call
+     * before start(); negative leaves it unpinned.
+     */
+    void setInputCore(int cpu) { inputCore = cpu; }
+    
+    /**
+     * Override the input thread's SCHED_FIFO priority. Call before start().
+     */
+    void setInputPriority(int priority) { inputPriority = priority; }
+    
     /**
      * Start the control surface.
      */
@@ -227,10 +300,13 @@ private:
     std::atomic<SecretMode> secretMode;
     std::atomic<int> secretModePreset{0};  // Current preset within secret mode (0-indexed)
 
-    // Shift button press tracking for secret mode activation
-    // Protected by pressesMutex for thread-safe access
-    mutable std::mutex pressesMutex;
-    std::vector<std::chrono::steady_clock::time_point> recentShiftPresses;
+    // Shift button press tracking for secret mode activation: a fixed ring
+    // of the latest press times, larger than the longest activation
+    // sequence (10). Only touched by the control thread, which runs every
+    // button handler.
+    static constexpr size_t SHIFT_PRESS_HISTORY = 16;
+    std::array<std::chrono::steady_clock::time_point, SHIFT_PRESS_HISTORY> recentShiftPresses{};
+    size_t shiftPressTotal = 0;
     
     // Parameter values
     struct Parameters {
@@ -253,6 +329,63 @@ private:
         float release = 0.5f;      // Moved from encoder control
     };
     Parameters params;
+    std::mutex paramsMutex;  // Input thread (encoders) vs control thread (presets)
+    
+    // Encoder-controlled parameters
+    enum class Param {
+        LfoDepth, BaseFreq, FilterFreq, DelayFeedback, ReverbMix,
+        LfoRate, DelayTime, FilterRes, OscWaveform, ReverbSize,
+        Count
+    };
+    
+    enum class ParamKind {
+        Linear,   // value += step * direction
+        Log,      // value *= step (or 1/step) per detent
+        Waveform  // cycles through the oscillator waveforms
+    };
+    
+    // How one encoder detent changes a parameter
+    struct ParamSpec {
+        const char* name;
+        ParamKind kind;
+        float step;
+        float minValue;
+        float maxValue;
+        float Parameters::* value;           // nullptr for Waveform
+        void (AudioEngine::* setter)(float);  // nullptr for Waveform
+    };
+    
+    static const ParamSpec PARAM_SPECS[static_cast<int>(Param::Count)];
+    static const Param BANK_PARAMS[2][5];  // [bank][encoder]
+    
+    // Encoder changes are coalesced: handlers record the new value and set a
+    // dirty bit, and the control thread applies each changed parameter to
+    // the engine at most once per flush interval (~100 Hz)
+    std::array<std::atomic<float>, static_cast<size_t>(Param::Count)> pendingValues;
+    std::atomic<uint32_t> dirtyParams{0};
+    void queueParameter(const ParamSpec& spec, float value);
+    void flushParameters();
+    
+    // Button and switch actions, handed from the input side to the control
+    // thread so slow work (console output, presets, shutdown) never stalls
+    // pin sampling
+    enum class ControlAction {
+        TriggerPress, TriggerRelease,
+        ShiftPress, ShiftRelease,
+        ShutdownPress,
+        PitchEnvChange
+    };
+    struct ControlEvent {
+        ControlAction action;
+        SwitchPosition position;  // PitchEnvChange only
+    };
+    std::mutex controlMutex;
+    std::condition_variable controlCv;
+    std::deque<ControlEvent> controlEvents;  // Protected by controlMutex
+    std::thread controlThread;
+    void postControlEvent(ControlAction action, SwitchPosition position = SwitchPosition::Off);
+    void dispatchControlEvent(const ControlEvent& event);
+    void controlLoop();
     
     // Hardware components
     std::array<std::unique_ptr<RotaryEncoder>, 5> encoders;
@@ -260,8 +393,19 @@ private:
     std::unique_ptr<ThreePositionSwitch> pitchEnvSwitch;      // 3-position pitch envelope
     std::unique_ptr<LEDController> ledController;             // Optional WS2812 status LED
     
+    // Input thread: waits for edges (libgpiod events, pigpio alerts) and samples the devices
+    std::thread inputThread;
+    int inputCore = -1;
+    int inputPriority = INPUT_THREAD_PRIORITY;
+    void inputLoop();
+    
+    // Log output from the input thread
+    enum LogProducer { LOG_INPUT = 0, NUM_LOG_PRODUCERS };
+    AsyncLogger logger;
+    
     // Encoder handlers
-    void handleEncoder(int encoderIndex, int direction);
+    std::chrono::steady_clock::time_point lastEncoderLog;  // Throttles value printouts
+    void handleEncoder(const ParamSpec& spec, Bank bank, int direction);
     
     // Button handlers
     void onTriggerPress();
@@ -280,6 +424,16 @@ private:
     void cycleSecretModePreset();
     void applySecretModePreset();
     
+    // Reset params to the Auto Wail defaults and push them to the engine
+    // (startup and secret-mode exit). Takes paramsMutex only to rewrite
+    // params; the engine is updated after it is released.
+    void applyDefaultParameters();
+    
+    // Push every field of a params snapshot to the engine in one pass
+    // (presets and defaults; call without paramsMutex held); per-detent
+    // encoder changes go through queueParameter()
+    void applyParameters(const Parameters& values);
+    
     // Apply parameter to engine
     void applyParameter(const char* name, float value);
     
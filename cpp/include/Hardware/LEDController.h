@@ -5,6 +5,7 @@
 #include <chrono>
 #include <cstdint>
 #include <functional>
+#include <mutex>
 #include <random>
 
 namespace DubSiren {
@@ -153,14 +154,17 @@ private:
     // Platform-specific LED handle (must be before rng for initialization order)
     void* ledHandle;  // ws2811_t* on Pi, nullptr on other platforms
     
-    // Color cycling state
+    // Color cycling state (update thread only; other threads request a
+    // restart through cycleResetPending)
     ColorPath currentPath;
     float cyclePosition;         // 0.0 - 1.0 within current cycle
+    std::atomic<bool> cycleResetPending;
     std::chrono::steady_clock::time_point lastUpdate;
     std::mt19937 rng;
     
-    // Direct color override
+    // Direct color override (set from the control thread, read by the update thread)
     std::atomic<bool> colorOverride;
+    std::mutex overrideMutex;
     Color overrideColor;
     
     // Startup transition timer (to avoid detached thread lifetime issues)
@@ -170,6 +174,9 @@ private:
     // Update loop
     void updateLoop();
     
+    void setOverrideColor(const Color& color);
+    Color getOverrideColor();
+    
     // Color calculation
     Color calculateColor();
     Color getNormalModeColor();
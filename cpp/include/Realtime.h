@@ -0,0 +1,103 @@
+#pragma once
+
+#include <pthread.h>
+#include <sched.h>
+#include <sys/mman.h>
+#include <cerrno>
+#include <cstring>
+#include <iostream>
+
+namespace DubSiren {
+
+// SCHED_FIFO priorities (1-99). The ALSA writer sits above the render
+// thread so a device write is never held off by rendering; both sit above
+// the priority systemd gives the rest of the process (see setup.sh). GPIO
+// input sampling goes just above that too, so edges are serviced ahead of
+// logging, LED and control work but never ahead of audio.
+constexpr int AUDIO_THREAD_PRIORITY = 85;
+constexpr int RENDER_THREAD_PRIORITY = 82;
+constexpr int INPUT_THREAD_PRIORITY = 81;
+
+/**
+ * Priority for a thread that sits a fixed distance below the ALSA writer,
+ * for when the writer's priority is overridden (--rt-priority).
+ * @param audioPriority Priority the ALSA writer thread runs at
+ * @param defaultPriority The thread's priority when audio is at AUDIO_THREAD_PRIORITY
+ */
+constexpr int relativeToAudioPriority(int audioPriority, int defaultPriority) {
+    int priority = audioPriority - (AUDIO_THREAD_PRIORITY - defaultPriority);
+    return priority < 1 ? 1 : priority;
+}
+
+/**
+ * Promote the calling thread to SCHED_FIFO at the given priority.
+ *
+ * Needs root, CAP_SYS_NICE or a sufficient RLIMIT_RTPRIO. On failure the
+ * thread keeps its current policy and a warning is printed, so callers can
+ * treat this as best-effort.
+ * @param priority SCHED_FIFO priority (1-99)
+ * @param name Thread name used in the warning message
+ * @return true if the policy was applied
+ */
+inline bool setCurrentThreadRealtime(int priority, const char* name) {
+    sched_param param{};
+    param.sched_priority = priority;
+    int err = pthread_setschedparam(pthread_self(), SCHED_FIFO, &param);
+    if (err != 0) {
+        std::cerr << "Warning: could not set " << name << " thread to SCHED_FIFO "
+                  << priority << ": " << std::strerror(err)
+                  << " (run as root or grant CAP_SYS_NICE)" << std::endl;
+        return false;
+    }
+    return true;
+}
+
+/**
+ * Lock the process's memory so real-time threads never stall on a page
+ * fault against swapped or reclaimed pages.
+ *
+ * Everything already mapped is locked, and later mappings are locked as
+ * they are first touched (MCL_ONFAULT) rather than up front, so each
+ * thread's mostly unused stack reservation isn't pinned in full. Call
+ * after the audio buffers are allocated and before the threads start.
+ * Needs root, CAP_IPC_LOCK or a sufficient RLIMIT_MEMLOCK; best-effort.
+ * @return true if the memory was locked
+ */
+inline bool lockProcessMemory() {
+    int flags = MCL_CURRENT | MCL_FUTURE;
+#ifdef MCL_ONFAULT
+    flags |= MCL_ONFAULT;
+#endif
+    if (mlockall(flags) != 0) {
+        std::cerr << "Warning: could not lock process memory: " << std::strerror(errno)
+                  << " (run as root or grant CAP_IPC_LOCK)" << std::endl;
+        return false;
+    }
+    return true;
+}
+
+/**
+ * Pin the calling thread to a single CPU.
+ *
+ * Meant for a core kept free of other work at boot (isolcpus=N
+ * nohz_full=N rcu_nocbs=N on the kernel command line); on a shared core it
+ * only limits where the thread may run. Best-effort like
+ * setCurrentThreadRealtime().
+ * @param cpu CPU index
+ * @param name Thread name used in the warning message
+ * @return true if the affinity was applied
+ */
+inline bool setCurrentThreadAffinity(int cpu, const char* name) {
+    cpu_set_t cpus;
+    CPU_ZERO(&cpus);
+    CPU_SET(cpu, &cpus);
+    int err = pthread_setaffinity_np(pthread_self(), sizeof(cpus), &cpus);
+    if (err != 0) {
+        std::cerr << "Warning: could not pin " << name << " thread to CPU "
+                  << cpu << ": " << std::strerror(err) << std::endl;
+        return false;
+    }
+    return true;
+}
+
+} // namespace DubSiren
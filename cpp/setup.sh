@@ -286,6 +286,10 @@ echo ""
 declare -a DEVICES
 declare -a CARD_NUMBERS
 INDEX=1
+LIKELY_DAC_INDEX=""
+
+# Lowercase name fragments that identify a PCM5102 / I2S DAC
+PCM5102_KEYWORDS='hifiberry|pcm5102|i2s'
 
 # Parse aplay -l output to get device info
 while IFS= read -r line; do
@@ -296,9 +300,10 @@ while IFS= read -r line; do
         DEVICES[$INDEX]="$CARD_NAME[$DEVICE_NAME]"
         CARD_NUMBERS[$INDEX]=$CARD_NUM
         
-        # Highlight likely PCM5102 devices
-        if [[ "$DEVICE_NAME" =~ hifiberry|HiFiBerry|pcm5102|PCM5102|i2s|I2S ]]; then
+        # Highlight likely PCM5102 devices (case-insensitive, name lowered once)
+        if [[ "${DEVICE_NAME,,}" =~ $PCM5102_KEYWORDS ]]; then
             echo -e "  ${GREEN}$INDEX) Card $CARD_NUM: $CARD_NAME[$DEVICE_NAME] ← Likely PCM5102${NC}"
+            LIKELY_DAC_INDEX=${LIKELY_DAC_INDEX:-$INDEX}
         else
             echo "  $INDEX) Card $CARD_NUM: $CARD_NAME[$DEVICE_NAME]"
         fi
@@ -316,10 +321,11 @@ else
     echo "Which audio device would you like to use?"
     echo "(For PCM5102 DAC, select the hifiberry-dac or snd_rpi_hifiberry_dac device)"
     echo ""
-    read -p "Enter number [1]: " DEVICE_CHOICE </dev/tty
+    # Default to the first likely PCM5102 device, else the first device
+    DEFAULT_CHOICE=${LIKELY_DAC_INDEX:-1}
+    read -p "Enter number [$DEFAULT_CHOICE]: " DEVICE_CHOICE </dev/tty
 
-    # Default to 1 if empty
-    DEVICE_CHOICE=${DEVICE_CHOICE:-1}
+    DEVICE_CHOICE=${DEVICE_CHOICE:-$DEFAULT_CHOICE}
 
     if [ $DEVICE_CHOICE -ge 1 ] && [ $DEVICE_CHOICE -lt $INDEX ]; then
         SELECTED_CARD=${CARD_NUMBERS[$DEVICE_CHOICE]}
@@ -414,10 +420,14 @@ Restart=on-failure
 RestartSec=5
 Nice=-10
 
-# Real-time priority for audio
+# Real-time priority for audio (the ALSA and render threads raise
+# themselves above this; requires root or CAP_SYS_NICE)
 CPUSchedulingPolicy=fifo
 CPUSchedulingPriority=80
 
+# Let the process mlockall() its memory so audio never waits on paging
+LimitMEMLOCK=infinity
+
 [Install]
 WantedBy=multi-user.target
 EOF
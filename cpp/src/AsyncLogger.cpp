@@ -0,0 +1,85 @@
+#include "AsyncLogger.h"
+#include <iostream>
+#include <chrono>
+
+namespace DubSiren {
+
+// How often the logger thread wakes to drain queues
+constexpr auto DRAIN_INTERVAL = std::chrono::milliseconds(20);
+
+AsyncLogger::AsyncLogger(int numProducers, size_t capacity)
+    : running(false)
+    , dropped(0)
+{
+    for (int i = 0; i < numProducers; ++i) {
+        queues.push_back(std::make_unique<RingBuffer<LogEvent>>(capacity));
+    }
+}
+
+AsyncLogger::~AsyncLogger() {
+    stop();
+}
+
+void AsyncLogger::start() {
+    if (running.load()) {
+        return;
+    }
+    running.store(true);
+    drainThread = std::thread(&AsyncLogger::drainLoop, this);
+}
+
+void AsyncLogger::stop() {
+    if (!running.load()) {
+        return;
+    }
+    {
+        std::lock_guard<std::mutex> lock(wakeMutex);
+        running.store(false);
+    }
+    wakeCv.notify_one();
+    if (drainThread.joinable()) {
+        drainThread.join();
+    }
+    drain();
+}
+
+bool AsyncLogger::post(int producer, const LogEvent& event) {
+    if (!queues[producer]->write(&event, 1)) {
+        dropped.fetch_add(1, std::memory_order_relaxed);
+        return false;
+    }
+    return true;
+}
+
+void AsyncLogger::drainLoop() {
+    std::unique_lock<std::mutex> lock(wakeMutex);
+    while (running.load()) {
+        wakeCv.wait_for(lock, DRAIN_INTERVAL, [this] { return !running.load(); });
+        lock.unlock();
+        drain();
+        lock.lock();
+    }
+}
+
+void AsyncLogger::drain() {
+    bool wrote = false;
+    LogEvent event;
+    for (auto& queue : queues) {
+        while (queue->read(&event, 1)) {
+            std::ostream& os = event.isError ? std::cerr : std::cout;
+            if (event.format) {
+                event.format(os, event);
+            } else if (event.text) {
+                os << event.text;
+            }
+            os << '\n';
+            wrote = true;
+        }
+    }
+    if (wrote) {
+        std::cout.flush();
+        std::cerr.flush();
+    }
+}
+
+} // namespace DubSiren
@@ -5,6 +5,28 @@
 
 namespace DubSiren {
 
+namespace {
+
+// Bits in AudioEngine::pendingParams, one per deferred DSP parameter
+enum PendingParam : uint32_t {
+    PARAM_WAVEFORM         = 1u << 0,
+    PARAM_ATTACK           = 1u << 1,
+    PARAM_RELEASE          = 1u << 2,
+    PARAM_LFO_RATE         = 1u << 3,
+    PARAM_LFO_DEPTH        = 1u << 4,
+    PARAM_LFO_WAVEFORM     = 1u << 5,
+    PARAM_FILTER_CUTOFF    = 1u << 6,
+    PARAM_FILTER_RESONANCE = 1u << 7,
+    PARAM_DELAY_TIME       = 1u << 8,
+    PARAM_DELAY_FEEDBACK   = 1u << 9,
+    PARAM_DELAY_MIX        = 1u << 10,
+    PARAM_REVERB_SIZE      = 1u << 11,
+    PARAM_REVERB_MIX       = 1u << 12,
+    PARAM_REVERB_DAMPING   = 1u << 13,
+};
+
+} // anonymous namespace
+
 AudioEngine::AudioEngine(int sampleRate, int bufferSize)
     : sampleRate(sampleRate)
     , bufferSize(bufferSize)
@@ -23,12 +45,17 @@ AudioEngine::AudioEngine(int sampleRate, int bufferSize)
     , inReleasePhase(false)
     , pitchEnvStartLevel(1.0f)
 {
-    // Pre-allocate buffers
-    oscBuffer.resize(bufferSize);
-    envBuffer.resize(bufferSize);
-    lfoBuffer.resize(bufferSize);
-    filterBuffer.resize(bufferSize);
-    delayBuffer.resize(bufferSize);
+    // Pre-allocate buffers: one block, split into cache-line-aligned lanes
+    constexpr size_t LINE_FLOATS = 64 / sizeof(float);
+    const size_t laneFloats = (static_cast<size_t>(bufferSize) + LINE_FLOATS - 1) / LINE_FLOATS * LINE_FLOATS;
+    scratch.assign(laneFloats * NUM_SCRATCH_LANES + LINE_FLOATS, 0.0f);
+    
+    float* lane = scratch.data();
+    lane += (LINE_FLOATS - (reinterpret_cast<uintptr_t>(lane) / sizeof(float)) % LINE_FLOATS) % LINE_FLOATS;
+    envBuffer = lane;
+    lfoBuffer = lane + laneFloats;
+    filterBuffer = lane + laneFloats * 2;
+    delayBuffer = lane + laneFloats * 3;
     
     // Set initial parameters (Auto Wail preset)
     oscillator.setWaveform(Waveform::Square);  // Square for classic siren sound
@@ -44,30 +71,67 @@ AudioEngine::AudioEngine(int sampleRate, int bufferSize)
 }
 
 void AudioEngine::process(float* output, int numFrames) {
+    // Render mono into the first half of the output, then expand to stereo
+    // in place, walking backwards so no unread sample is overwritten
+    processMono(output, numFrames);
+    for (int i = numFrames - 1; i >= 0; --i) {
+        float sample = clamp(output[i], -1.0f, 1.0f);
+        output[i * 2] = sample;      // Left
+        output[i * 2 + 1] = sample;  // Right
+    }
+}
+
+void AudioEngine::processMono(float* output, int numFrames) {
+    while (numFrames > 0) {
+        int chunk = std::min(numFrames, bufferSize);
+        renderBlock(output, chunk);
+        output += chunk;
+        numFrames -= chunk;
+    }
+}
+
+void AudioEngine::renderBlock(float* output, int numFrames) {
+    // Hand parameter changes made since the last block to the DSP objects
+    applyPendingParameters();
+    
     // Get pitch envelope mode
     PitchEnvelopeMode pitchMode = pitchEnvMode.get();
     float baseFreq = baseFrequency.get();
     float pitchDepth = lfoPitchDepth.get();
+    
+    // Work on local copies of buffer pointers and loop-carried state: the
+    // DSP calls below are opaque to the compiler, so member accesses would
+    // otherwise be reloaded from memory on every sample
+    float* env = envBuffer;
+    float* lfoMod = lfoBuffer;
+    float* filtered = filterBuffer;
+    float* wet = delayBuffer;
+    const bool releaseStartedBlock = inReleasePhase;
+    bool releasing = releaseStartedBlock;
+    const float releaseStartLevel = pitchEnvStartLevel;
 
     // Generate envelope first (we need it for pitch envelope calculation)
-    envelope.generate(envBuffer.data(), numFrames);
+    envelope.generate(env, numFrames);
 
     // Generate LFO modulation (needed for pitch modulation)
-    lfo.generate(lfoBuffer.data(), numFrames);
+    lfo.generate(lfoMod, numFrames);
 
-    // Generate oscillator with pitch envelope and LFO pitch modulation
+    // Voice: oscillator (with pitch envelope and LFO pitch modulation),
+    // LFO-swept filter and envelope gain in one pass, so each sample stays
+    // in registers from the oscillator to the filtered buffer
+    float baseCutoff = filter.getCutoff();
     for (int i = 0; i < numFrames; ++i) {
         float targetFreq = baseFreq;
         
         // Apply pitch envelope during release phase
-        if (inReleasePhase && pitchMode != PitchEnvelopeMode::None) {
-            float envValue = envBuffer[i];
+        if (releasing && pitchMode != PitchEnvelopeMode::None) {
+            float envValue = env[i];
             
             // Calculate how far through release we are (0 = just started, 1 = finished)
             // envValue goes from pitchEnvStartLevel down to 0
             float releaseProgress = 0.0f;
-            if (pitchEnvStartLevel > 0.001f) {
-                releaseProgress = 1.0f - (envValue / pitchEnvStartLevel);
+            if (releaseStartLevel > 0.001f) {
+                releaseProgress = 1.0f - (envValue / releaseStartLevel);
                 releaseProgress = clamp(releaseProgress, 0.0f, 1.0f);
             }
             
@@ -85,7 +149,7 @@ void AudioEngine::process(float* output, int numFrames) {
             
             // End release phase when envelope is essentially done
             if (envValue < 0.001f) {
-                inReleasePhase = false;
+                releasing = false;
             }
         }
 
@@ -93,7 +157,7 @@ void AudioEngine::process(float* output, int numFrames) {
         if (pitchDepth > 0.001f) {
             // LFO modulates pitch by ±N octaves where N = pitchDepth
             // lfoBuffer[i] ranges from -1 to +1, so we multiply by pitchDepth to get the octave range
-            float octaveShift = lfoBuffer[i] * pitchDepth;
+            float octaveShift = lfoMod[i] * pitchDepth;
             float pitchMult = std::pow(2.0f, octaveShift);
             targetFreq *= pitchMult;
         }
@@ -102,49 +166,56 @@ void AudioEngine::process(float* output, int numFrames) {
         frequencySmooth.setTarget(targetFreq);
         currentFrequency = frequencySmooth.getNext();
         oscillator.setFrequency(currentFrequency);
-        oscBuffer[i] = oscillator.generateSample();
-    }
-
-    // Apply LFO to filter cutoff and process
-    float baseCutoff = filter.getCutoff();
-    for (int i = 0; i < numFrames; ++i) {
+        float oscSample = oscillator.generateSample();
+        
         // LFO modulates filter cutoff by up to ±3 octaves (scaled by depth)
-        float modCutoff = baseCutoff * std::pow(2.0f, lfoBuffer[i] * 3.0f);
+        float modCutoff = baseCutoff * std::pow(2.0f, lfoMod[i] * 3.0f);
         modCutoff = clamp(modCutoff, 20.0f, 12000.0f);
         filter.setCutoff(modCutoff);
-        filterBuffer[i] = filter.processSample(oscBuffer[i]);
+        float voice = filter.processSample(oscSample);
+        
+        // Apply envelope
+        filtered[i] = (env[i] < 0.001f) ? 0.0f : voice * env[i];
     }
     filter.setCutoff(baseCutoff);
-    
-    // Apply envelope
-    for (int i = 0; i < numFrames; ++i) {
-        if (envBuffer[i] < 0.001f) {
-            filterBuffer[i] = 0.0f;
-        } else {
-            filterBuffer[i] *= envBuffer[i];
-        }
+    if (releaseStartedBlock && !releasing) {
+        inReleasePhase = false;  // Only clear; release() may set it concurrently
     }
     
-    // Apply delay
-    delay.process(filterBuffer.data(), delayBuffer.data(), numFrames);
-    std::copy(delayBuffer.begin(), delayBuffer.begin() + numFrames, filterBuffer.begin());
-    
-    // Apply reverb
-    reverb.process(filterBuffer.data(), delayBuffer.data(), numFrames);
-    std::copy(delayBuffer.begin(), delayBuffer.begin() + numFrames, filterBuffer.begin());
+    // Apply delay, then reverb, ping-ponging between the two scratch lanes
+    // instead of copying each effect's output back
+    delay.process(filtered, wet, numFrames);
+    reverb.process(wet, filtered, numFrames);
     
-    // Apply DC blocking
-    dcBlocker.process(filterBuffer.data(), filterBuffer.data(), numFrames);
-    
-    // Apply volume and convert to stereo interleaved
+    // Apply DC blocking, volume and the output soft limiter
     float vol = volume.get();
     for (int i = 0; i < numFrames; ++i) {
-        float sample = clamp(filterBuffer[i] * vol, -1.0f, 1.0f);
-        output[i * 2] = sample;      // Left
-        output[i * 2 + 1] = sample;  // Right
+        output[i] = softLimit(dcBlocker.processSample(filtered[i]) * vol);
     }
 }
 
+void AudioEngine::applyPendingParameters() {
+    uint32_t dirty = pendingParams.exchange(0, std::memory_order_acquire);
+    if (dirty == 0) {
+        return;
+    }
+    
+    if (dirty & PARAM_WAVEFORM) oscillator.setWaveform(waveform.get());
+    if (dirty & PARAM_ATTACK) envelope.setAttack(attackTime.get());
+    if (dirty & PARAM_RELEASE) envelope.setRelease(releaseTime.get());
+    if (dirty & PARAM_LFO_RATE) lfo.setFrequency(lfoRate.get());
+    if (dirty & PARAM_LFO_DEPTH) lfo.setDepth(lfoDepth.get());
+    if (dirty & PARAM_LFO_WAVEFORM) lfo.setWaveform(lfoWaveform.get());
+    if (dirty & PARAM_FILTER_CUTOFF) filter.setCutoff(filterCutoff.get());
+    if (dirty & PARAM_FILTER_RESONANCE) filter.setResonance(filterResonance.get());
+    if (dirty & PARAM_DELAY_TIME) delay.setDelayTime(delayTime.get());
+    if (dirty & PARAM_DELAY_FEEDBACK) delay.setFeedback(delayFeedback.get());
+    if (dirty & PARAM_DELAY_MIX) delay.setDryWet(delayMix.get());
+    if (dirty & PARAM_REVERB_SIZE) reverb.setSize(reverbSize.get());
+    if (dirty & PARAM_REVERB_MIX) reverb.setDryWet(reverbMix.get());
+    if (dirty & PARAM_REVERB_DAMPING) reverb.setDamping(reverbDamping.get());
+}
+
 void AudioEngine::trigger() {
     std::lock_guard<std::mutex> lock(triggerMutex);
     oscillator.resetPhase();
@@ -200,7 +271,8 @@ void AudioEngine::setFrequency(float freq) {
 }
 
 void AudioEngine::setWaveform(Waveform wf) {
-    oscillator.setWaveform(wf);
+    waveform.set(wf);
+    pendingParams.fetch_or(PARAM_WAVEFORM, std::memory_order_release);
 }
 
 void AudioEngine::setWaveform(int index) {
@@ -208,19 +280,23 @@ void AudioEngine::setWaveform(int index) {
 }
 
 void AudioEngine::setAttackTime(float seconds) {
-    envelope.setAttack(seconds);
+    attackTime.set(seconds);
+    pendingParams.fetch_or(PARAM_ATTACK, std::memory_order_release);
 }
 
 void AudioEngine::setReleaseTime(float seconds) {
-    envelope.setRelease(seconds);
+    releaseTime.set(seconds);
+    pendingParams.fetch_or(PARAM_RELEASE, std::memory_order_release);
 }
 
 void AudioEngine::setLfoRate(float rate) {
-    lfo.setFrequency(rate);
+    lfoRate.set(rate);
+    pendingParams.fetch_or(PARAM_LFO_RATE, std::memory_order_release);
 }
 
 void AudioEngine::setLfoDepth(float depth) {
-    lfo.setDepth(depth);
+    lfoDepth.set(depth);
+    pendingParams.fetch_or(PARAM_LFO_DEPTH, std::memory_order_release);
 }
 
 void AudioEngine::setLfoPitchDepth(float depth) {
@@ -228,7 +304,8 @@ void AudioEngine::setLfoPitchDepth(float depth) {
 }
 
 void AudioEngine::setLfoWaveform(Waveform wf) {
-    lfo.setWaveform(wf);
+    lfoWaveform.set(wf);
+    pendingParams.fetch_or(PARAM_LFO_WAVEFORM, std::memory_order_release);
 }
 
 void AudioEngine::setLfoWaveform(int index) {
@@ -236,35 +313,43 @@ void AudioEngine::setLfoWaveform(int index) {
 }
 
 void AudioEngine::setFilterCutoff(float freq) {
-    filter.setCutoff(freq);
+    filterCutoff.set(freq);
+    pendingParams.fetch_or(PARAM_FILTER_CUTOFF, std::memory_order_release);
 }
 
 void AudioEngine::setFilterResonance(float res) {
-    filter.setResonance(res);
+    filterResonance.set(res);
+    pendingParams.fetch_or(PARAM_FILTER_RESONANCE, std::memory_order_release);
 }
 
 void AudioEngine::setDelayTime(float seconds) {
-    delay.setDelayTime(seconds);
+    delayTime.set(seconds);
+    pendingParams.fetch_or(PARAM_DELAY_TIME, std::memory_order_release);
 }
 
 void AudioEngine::setDelayFeedback(float feedback) {
-    delay.setFeedback(feedback);
+    delayFeedback.set(feedback);
+    pendingParams.fetch_or(PARAM_DELAY_FEEDBACK, std::memory_order_release);
 }
 
 void AudioEngine::setDelayMix(float mix) {
-    delay.setDryWet(mix);
+    delayMix.set(mix);
+    pendingParams.fetch_or(PARAM_DELAY_MIX, std::memory_order_release);
 }
 
 void AudioEngine::setReverbSize(float size) {
-    reverb.setSize(size);
+    reverbSize.set(size);
+    pendingParams.fetch_or(PARAM_REVERB_SIZE, std::memory_order_release);
 }
 
 void AudioEngine::setReverbMix(float mix) {
-    reverb.setDryWet(mix);
+    reverbMix.set(mix);
+    pendingParams.fetch_or(PARAM_REVERB_MIX, std::memory_order_release);
 }
 
 void AudioEngine::setReverbDamping(float damping) {
-    reverb.setDamping(damping);
+    reverbDamping.set(damping);
+    pendingParams.fetch_or(PARAM_REVERB_DAMPING, std::memory_order_release);
 }
 
 void AudioEngine::setPitchEnvelopeMode(PitchEnvelopeMode mode) {
@@ -1,4 +1,5 @@
 #include "Audio/AudioOutput.h"
+#include "Realtime.h"
 #include <iostream>
 #include <iomanip>
 #include <chrono>
@@ -10,8 +11,246 @@
 #include <alsa/asoundlib.h>
 #endif
 
+#if defined(__ARM_NEON) || defined(__ARM_NEON__)
+#include <arm_neon.h>
+#define DUBSIREN_NEON 1
+#endif
+
 namespace DubSiren {
 
+#ifdef HAVE_ALSA
+namespace {
+
+constexpr unsigned int OUTPUT_LATENCY_US = 50000;  // 50ms
+
+/**
+ * Configure the device with one hardware period per engine block, so each
+ * interrupt wakes the writer for exactly one writei() of bufferSize frames.
+ * periods <= 0 picks enough periods to cover OUTPUT_LATENCY_US. The device
+ * may round both values; the ones it accepted are returned.
+ * @return 0 on success, negative ALSA error code on failure
+ */
+int configurePcm(snd_pcm_t* pcm, int channels, int sampleRate, int periodFrames, int periods,
+                 snd_pcm_uframes_t& actualPeriod, snd_pcm_uframes_t& actualBuffer) {
+    if (periods <= 0) {
+        int64_t latencyFrames = static_cast<int64_t>(OUTPUT_LATENCY_US) * sampleRate / 1000000;
+        periods = std::max(2, static_cast<int>((latencyFrames + periodFrames - 1) / periodFrames));
+    }
+    
+    snd_pcm_hw_params_t* hw;
+    snd_pcm_hw_params_alloca(&hw);
+    unsigned int rate = static_cast<unsigned int>(sampleRate);
+    unsigned int count = static_cast<unsigned int>(periods);
+    actualPeriod = static_cast<snd_pcm_uframes_t>(periodFrames);
+    
+    int err;
+    if ((err = snd_pcm_hw_params_any(pcm, hw)) < 0 ||
+        (err = snd_pcm_hw_params_set_rate_resample(pcm, hw, 1)) < 0 ||
+        (err = snd_pcm_hw_params_set_access(pcm, hw, SND_PCM_ACCESS_RW_INTERLEAVED)) < 0 ||
+        (err = snd_pcm_hw_params_set_format(pcm, hw, SND_PCM_FORMAT_S16_LE)) < 0 ||
+        (err = snd_pcm_hw_params_set_channels(pcm, hw, static_cast<unsigned int>(channels))) < 0 ||
+        (err = snd_pcm_hw_params_set_rate_near(pcm, hw, &rate, nullptr)) < 0 ||
+        (err = snd_pcm_hw_params_set_period_size_near(pcm, hw, &actualPeriod, nullptr)) < 0 ||
+        (err = snd_pcm_hw_params_set_periods_near(pcm, hw, &count, nullptr)) < 0 ||
+        (err = snd_pcm_hw_params(pcm, hw)) < 0) {
+        return err;
+    }
+    snd_pcm_hw_params_get_period_size(hw, &actualPeriod, nullptr);
+    snd_pcm_hw_params_get_buffer_size(hw, &actualBuffer);
+    
+    // Start playback once the buffer has been primed, and wake the writer
+    // whenever a period's worth of space is free
+    snd_pcm_sw_params_t* sw;
+    snd_pcm_sw_params_alloca(&sw);
+    if ((err = snd_pcm_sw_params_current(pcm, sw)) < 0 ||
+        (err = snd_pcm_sw_params_set_start_threshold(pcm, sw, actualBuffer)) < 0 ||
+        (err = snd_pcm_sw_params_set_avail_min(pcm, sw, actualPeriod)) < 0 ||
+        (err = snd_pcm_sw_params(pcm, sw)) < 0) {
+        return err;
+    }
+    return 0;
+}
+
+// Each statistics counter is written by exactly one thread, so a relaxed
+// load + store replaces the locked read-modify-write of fetch_add; readers
+// on other threads may simply see a slightly stale value
+inline void bumpCounter(std::atomic<uint64_t>& counter) {
+    counter.store(counter.load(std::memory_order_relaxed) + 1, std::memory_order_relaxed);
+}
+
+// Formatters for events posted from the audio threads (run on the logger thread)
+void formatUnderrun(std::ostream& os, const LogEvent& event) {
+    os << "[ALSA] Underrun! " << snd_strerror(event.code);
+}
+
+void formatRecoveryFailed(std::ostream& os, const LogEvent& event) {
+    os << "[ALSA] Recovery failed: " << snd_strerror(event.code);
+}
+
+void formatCpuUsage(std::ostream& os, const LogEvent& event) {
+    std::ios::fmtflags flags = os.flags();
+    std::streamsize precision = os.precision();
+    float avgCpu = event.values[0];
+    float cpuMax = event.values[1];
+    os << "[CPU] avg=" << std::fixed << std::setprecision(1) << avgCpu
+       << "% max=" << cpuMax << "% (headroom: " << (100.0f - cpuMax) << "%)";
+    os.flags(flags);
+    os.precision(precision);
+}
+
+// Float exponent field; all ones means NaN or Inf
+constexpr uint32_t EXPONENT_MASK = 0x7F800000u;
+
+inline uint32_t exponentBits(float sample) {
+    uint32_t bits;
+    std::memcpy(&bits, &sample, sizeof(bits));
+    return bits & EXPONENT_MASK;
+}
+
+/**
+ * Clip and scale one sample to int16. Non-finite input is not handled
+ * here beyond being well defined (clamp maps NaN to full scale); kernels
+ * detect it separately and redo the buffer through the sanitizing path.
+ */
+inline int16_t toS16(float sample) {
+    return static_cast<int16_t>(clamp(sample, -1.0f, 1.0f) * 32767.0f);
+}
+
+/**
+ * Slow path, only taken for buffers that contain NaN/Inf: convert with
+ * non-finite samples replaced by silence.
+ */
+void renderSanitizedS16(const float* mono, int16_t* out, int numFrames, int channels) {
+    for (int i = 0; i < numFrames; ++i) {
+        float sample = mono[i];
+        int16_t value = isFiniteSample(sample) ? toS16(sample) : 0;
+        for (int ch = 0; ch < channels; ++ch) {
+            out[i * channels + ch] = value;
+        }
+    }
+}
+
+/*
+ * The fast kernels below don't test each sample. They track the largest
+ * exponent field seen (one integer max per sample) and compare it once
+ * per buffer; only if it reached all ones is the buffer redone through
+ * renderSanitizedS16. Each returns true if that happened.
+ */
+
+/**
+ * Stereo variant: both channels of a frame are written as a single
+ * 32-bit store of the sample replicated into each half, so the loop is a
+ * plain contiguous store stream the compiler can vectorize. On ARM the
+ * bulk of the buffer goes through an explicit NEON loop.
+ */
+bool renderStereoS16(const float* mono, int16_t* out, int numFrames) {
+    uint32_t maxExponent = 0;
+    int i = 0;
+    
+#ifdef DUBSIREN_NEON
+    // Four frames per iteration: track the exponent maximum, clip, scale,
+    // narrow to int16 and store L/R pairs with an interleaving vst2.
+    // Conversion truncates toward zero like the scalar path.
+    const uint32x4_t expMask = vdupq_n_u32(EXPONENT_MASK);
+    const float32x4_t lo = vdupq_n_f32(-1.0f);
+    const float32x4_t hi = vdupq_n_f32(1.0f);
+    const float32x4_t scale = vdupq_n_f32(32767.0f);
+    uint32x4_t expMax = vdupq_n_u32(0);
+    
+    for (; i + 4 <= numFrames; i += 4) {
+        float32x4_t v = vld1q_f32(mono + i);
+        expMax = vmaxq_u32(expMax, vandq_u32(vreinterpretq_u32_f32(v), expMask));
+        v = vmaxq_f32(vminq_f32(v, hi), lo);
+        int16x4_t s = vmovn_s32(vcvtq_s32_f32(vmulq_f32(v, scale)));
+        int16x4x2_t lr = {{ s, s }};
+        vst2_s16(out + i * 2, lr);
+    }
+    
+    uint32x2_t folded = vmax_u32(vget_low_u32(expMax), vget_high_u32(expMax));
+    maxExponent = std::max(vget_lane_u32(folded, 0), vget_lane_u32(folded, 1));
+#endif
+    
+    for (; i < numFrames; ++i) {
+        maxExponent = std::max(maxExponent, exponentBits(mono[i]));
+        uint32_t half = static_cast<uint16_t>(toS16(mono[i]));
+        uint32_t frame = half * 0x00010001u;
+        std::memcpy(out + i * 2, &frame, sizeof(frame));
+    }
+    
+    if (maxExponent != EXPONENT_MASK) {
+        return false;
+    }
+    renderSanitizedS16(mono, out, numFrames, 2);
+    return true;
+}
+
+/**
+ * Mono variant: one int16 per frame.
+ */
+bool renderMonoS16(const float* mono, int16_t* out, int numFrames) {
+    uint32_t maxExponent = 0;
+    for (int i = 0; i < numFrames; ++i) {
+        maxExponent = std::max(maxExponent, exponentBits(mono[i]));
+        out[i] = toS16(mono[i]);
+    }
+    
+    if (maxExponent != EXPONENT_MASK) {
+        return false;
+    }
+    renderSanitizedS16(mono, out, numFrames, 1);
+    return true;
+}
+
+/**
+ * Generic variant for any channel count.
+ */
+bool renderMultiS16(const float* mono, int16_t* out, int numFrames, int channels) {
+    uint32_t maxExponent = 0;
+    for (int i = 0; i < numFrames; ++i) {
+        maxExponent = std::max(maxExponent, exponentBits(mono[i]));
+        int16_t value = toS16(mono[i]);
+        for (int ch = 0; ch < channels; ++ch) {
+            out[i * channels + ch] = value;
+        }
+    }
+    
+    if (maxExponent != EXPONENT_MASK) {
+        return false;
+    }
+    renderSanitizedS16(mono, out, numFrames, channels);
+    return true;
+}
+
+/**
+ * Converts engine output to the DAC format in a single pass: replace
+ * non-finite samples with silence, clip, scale to int16 and duplicate
+ * across all output channels. Returns true if any non-finite sample was
+ * seen.
+ */
+using RenderKernel = bool (*)(const float* mono, int16_t* out, int numFrames, int channels);
+
+/**
+ * Pick the conversion kernel for a fixed channel count, so the render
+ * loop calls a specialized routine without re-checking the layout.
+ */
+RenderKernel selectRenderKernel(int channels) {
+    switch (channels) {
+        case 1:
+            return [](const float* mono, int16_t* out, int numFrames, int) {
+                return renderMonoS16(mono, out, numFrames);
+            };
+        case 2:
+            return [](const float* mono, int16_t* out, int numFrames, int) {
+                return renderStereoS16(mono, out, numFrames);
+            };
+        default:
+            return renderMultiS16;
+    }
+}
+
+} // anonymous namespace
+#endif
+
 // ============================================================================
 // AudioOutput Implementation (ALSA)
 // ============================================================================
@@ -27,8 +266,14 @@ AudioOutput::AudioOutput(AudioEngine& engine,
     , channels(channels)
     , deviceName(device ? device : "default")
     , running(false)
+    , ring(static_cast<size_t>(bufferSize * channels * RING_BLOCKS))
+    , monoBuffer(bufferSize * RENDER_BATCH)
+    , renderBuffer(bufferSize * channels * RENDER_BATCH)
+    , intBuffer(bufferSize * channels)
+    , logger(NUM_LOG_PRODUCERS)
     , totalBuffers(0)
     , underruns(0)
+    , nanBuffers(0)
     , lastCpuUsage(0.0f)
 {
 }
@@ -44,7 +289,9 @@ bool AudioOutput::start() {
         return true;
     }
     
+    logger.start();
     running.store(true);
+    renderThread = std::thread(&AudioOutput::renderLoop, this);
     audioThread = std::thread(&AudioOutput::audioLoop, this);
     
     std::cout << "Audio output started: " << sampleRate << "Hz, " 
@@ -68,16 +315,24 @@ void AudioOutput::stop() {
     if (audioThread.joinable()) {
         audioThread.join();
     }
+    if (renderThread.joinable()) {
+        renderThread.join();
+    }
+    logger.stop();
     
     // Print statistics
     uint64_t total = totalBuffers.load();
     uint64_t under = underruns.load();
+    uint64_t nans = nanBuffers.load();
     
     if (total > 0) {
         float underrunRate = static_cast<float>(under) / static_cast<float>(total) * 100.0f;
         std::cout << "\nAudio performance:" << std::endl;
         std::cout << "  Total buffers: " << total << std::endl;
         std::cout << "  Buffer underruns: " << under << " (" << underrunRate << "%)" << std::endl;
+        if (nans > 0) {
+            std::cout << "  Non-finite buffers: " << nans << std::endl;
+        }
     }
     
     std::cout << "Audio output stopped" << std::endl;
@@ -85,6 +340,11 @@ void AudioOutput::stop() {
 
 void AudioOutput::audioLoop() {
 #ifdef HAVE_ALSA
+    setCurrentThreadRealtime(audioPriority, "audio");
+    if (audioCore >= 0) {
+        setCurrentThreadAffinity(audioCore, "audio");
+    }
+    
     snd_pcm_t* pcm = nullptr;
     int err;
     
@@ -97,30 +357,86 @@ void AudioOutput::audioLoop() {
         return;
     }
     
-    // Use snd_pcm_set_params for ALSA configuration
-    // 50ms latency - good balance of responsiveness and stability
-    err = snd_pcm_set_params(pcm,
-                              SND_PCM_FORMAT_S16_LE,
-                              SND_PCM_ACCESS_RW_INTERLEAVED,
-                              channels,
-                              sampleRate,
-                              1,  // allow resampling
-                              50000);  // latency in us (50ms)
+    snd_pcm_uframes_t periodFrames = 0;
+    snd_pcm_uframes_t bufferFrames = 0;
+    err = configurePcm(pcm, channels, sampleRate, bufferSize, periods, periodFrames, bufferFrames);
     if (err < 0) {
         std::cerr << "Cannot set PCM parameters: " << snd_strerror(err) << std::endl;
         snd_pcm_close(pcm);
         running.store(false);
         return;
     }
+    std::cout << "ALSA period: " << periodFrames << " frames x "
+              << (bufferFrames / periodFrames) << " periods ("
+              << (bufferFrames * 1000 / static_cast<snd_pcm_uframes_t>(sampleRate)) << " ms buffer)" << std::endl;
     
-    // PCM configured successfully
+    // Prime the device with silence covering its buffer so the first real
+    // block doesn't arrive at an empty buffer and underrun while the
+    // engine's first pass warms caches and faults in pages
+    int primeBlocks = static_cast<int>(bufferFrames / static_cast<snd_pcm_uframes_t>(bufferSize));
+    std::fill(intBuffer.begin(), intBuffer.end(), static_cast<int16_t>(0));
+    for (int i = 0; i < primeBlocks; ++i) {
+        snd_pcm_sframes_t primed = snd_pcm_writei(pcm, intBuffer.data(), bufferSize);
+        if (primed < 0) {
+            snd_pcm_recover(pcm, static_cast<int>(primed), 1);
+            break;
+        }
+    }
     
-    // Allocate buffers
-    std::vector<float> floatBuffer(bufferSize * channels);
-    std::vector<int16_t> intBuffer(bufferSize * channels);
+    const size_t blockSamples = intBuffer.size();
     
-    // Calculate expected buffer duration for CPU usage estimation
-    double bufferDuration = static_cast<double>(bufferSize) / static_cast<double>(sampleRate);
+    while (running.load()) {
+        // Take the next rendered block; fall back to silence if the render
+        // thread fell behind
+        if (!ring.read(intBuffer.data(), blockSamples)) {
+            std::fill(intBuffer.begin(), intBuffer.end(), static_cast<int16_t>(0));
+            bumpCounter(underruns);
+        }
+        
+        // Write to ALSA
+        snd_pcm_sframes_t frames = snd_pcm_writei(pcm, intBuffer.data(), bufferSize);
+        
+        if (frames < 0) {
+            // Handle underrun (logging is deferred to the logger thread)
+            bumpCounter(underruns);
+            LogEvent event;
+            event.format = formatUnderrun;
+            event.isError = true;
+            event.code = static_cast<int>(frames);
+            logger.post(LOG_AUDIO, event);
+            
+            frames = snd_pcm_recover(pcm, static_cast<int>(frames), 0);
+            if (frames < 0) {
+                event.format = formatRecoveryFailed;
+                event.code = static_cast<int>(frames);
+                logger.post(LOG_AUDIO, event);
+            }
+        }
+        
+        bumpCounter(totalBuffers);
+    }
+    
+    // Drain and close
+    snd_pcm_drain(pcm);
+    snd_pcm_close(pcm);
+#endif
+}
+
+void AudioOutput::renderLoop() {
+#ifdef HAVE_ALSA
+    setCurrentThreadRealtime(relativeToAudioPriority(audioPriority, RENDER_THREAD_PRIORITY), "render");
+    if (audioCore >= 0) {
+        setCurrentThreadAffinity(audioCore, "render");
+    }
+    
+    const size_t batchSamples = renderBuffer.size();
+    const int batchFrames = bufferSize * RENDER_BATCH;
+    const RenderKernel renderKernel = selectRenderKernel(channels);
+    
+    // Calculate expected batch duration for CPU usage estimation
+    double bufferDuration = static_cast<double>(batchFrames) / static_cast<double>(sampleRate);
+    auto pollInterval = std::chrono::duration<double>(
+        static_cast<double>(bufferSize) / static_cast<double>(sampleRate) / 4.0);
     
     // CPU logging variables (logs every 10 seconds)
     float cpuSum = 0.0f;
@@ -130,60 +446,50 @@ void AudioOutput::audioLoop() {
     const auto logInterval = std::chrono::seconds(10);
     
     while (running.load()) {
-        auto startTime = std::chrono::high_resolution_clock::now();
+        // Not enough room for a batch - wait for the ALSA thread to drain
+        if (ring.availableToWrite() < batchSamples) {
+            std::this_thread::sleep_for(pollInterval);
+            continue;
+        }
         
-        // Generate audio
-        engine.process(floatBuffer.data(), bufferSize);
+        auto startTime = std::chrono::high_resolution_clock::now();
         
-        // Convert to int16
-        for (size_t i = 0; i < floatBuffer.size(); ++i) {
-            float sample = clamp(floatBuffer[i], -1.0f, 1.0f);
-            intBuffer[i] = static_cast<int16_t>(sample * 32767.0f);
+        // Generate mono audio, then sanitize/clip/convert/interleave in one pass
+        engine.processMono(monoBuffer.data(), batchFrames);
+        bool sawNonFinite = renderKernel(monoBuffer.data(), renderBuffer.data(),
+                                         batchFrames, channels);
+        if (sawNonFinite) {
+            bumpCounter(nanBuffers);
         }
         
         auto processTime = std::chrono::high_resolution_clock::now();
         
-        // Write to ALSA
-        snd_pcm_sframes_t frames = snd_pcm_writei(pcm, intBuffer.data(), bufferSize);
-        
-        if (frames < 0) {
-            // Handle underrun
-            underruns.fetch_add(1);
-            std::cerr << "[ALSA] Underrun! " << snd_strerror(static_cast<int>(frames)) << std::endl;
-            frames = snd_pcm_recover(pcm, static_cast<int>(frames), 0);
-            if (frames < 0) {
-                std::cerr << "[ALSA] Recovery failed: " << snd_strerror(static_cast<int>(frames)) << std::endl;
-            }
-        }
-        
-        totalBuffers.fetch_add(1);
+        ring.write(renderBuffer.data(), batchSamples);
         
         // Calculate CPU usage (processing time vs available time)
         std::chrono::duration<double> processDuration = processTime - startTime;
         float cpuUsage = static_cast<float>(processDuration.count() / bufferDuration * 100.0);
-        lastCpuUsage.store(cpuUsage);
+        lastCpuUsage.store(cpuUsage, std::memory_order_relaxed);
         
         // Accumulate for logging
         cpuSum += cpuUsage;
         if (cpuUsage > cpuMax) cpuMax = cpuUsage;
         cpuSamples++;
         
-        // Log CPU usage every 2 seconds
+        // Log CPU usage every 10 seconds
         auto now = std::chrono::steady_clock::now();
         if (now - lastLogTime >= logInterval && cpuSamples > 0) {
-            float avgCpu = cpuSum / cpuSamples;
-            std::cout << "[CPU] avg=" << std::fixed << std::setprecision(1) << avgCpu 
-                      << "% max=" << cpuMax << "% (headroom: " << (100.0f - cpuMax) << "%)" << std::endl;
+            LogEvent event;
+            event.format = formatCpuUsage;
+            event.values[0] = cpuSum / cpuSamples;
+            event.values[1] = cpuMax;
+            logger.post(LOG_RENDER, event);
             cpuSum = 0.0f;
             cpuMax = 0.0f;
             cpuSamples = 0;
             lastLogTime = now;
         }
     }
-    
-    // Drain and close
-    snd_pcm_drain(pcm);
-    snd_pcm_close(pcm);
 #endif
 }
 
@@ -191,6 +497,7 @@ AudioOutput::Stats AudioOutput::getStats() const {
     return {
         totalBuffers.load(),
         underruns.load(),
+        nanBuffers.load(),
         lastCpuUsage.load()
     };
 }
@@ -241,14 +548,21 @@ void SimulatedAudioOutput::stop() {
 void SimulatedAudioOutput::simulationLoop() {
     // Simulate audio callback at regular intervals
     double bufferDuration = static_cast<double>(bufferSize) / static_cast<double>(DEFAULT_SAMPLE_RATE);
-    auto sleepDuration = std::chrono::duration<double>(bufferDuration);
+    auto period = std::chrono::duration_cast<std::chrono::steady_clock::duration>(
+        std::chrono::duration<double>(bufferDuration));
+    
+    // Schedule against an absolute deadline so processing time doesn't
+    // accumulate as drift; an engine that can't keep up falls further
+    // behind the deadline instead of silently stretching the period
+    auto deadline = std::chrono::steady_clock::now();
     
     while (running.load()) {
         // Generate audio (but don't output it)
         engine.process(buffer.data(), bufferSize);
         
-        // Sleep to simulate real-time behavior
-        std::this_thread::sleep_for(sleepDuration);
+        // Sleep until the next buffer is due
+        deadline += period;
+        std::this_thread::sleep_until(deadline);
     }
 }
 
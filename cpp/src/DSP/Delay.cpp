@@ -1,4 +1,5 @@
 #include "DSP/Delay.h"
+#include "DSP/SineTable.h"
 #include <cmath>
 #include <algorithm>
 
@@ -7,7 +8,8 @@ namespace DubSiren {
 DelayEffect::DelayEffect(int sampleRate, float maxDelay)
     : sampleRate(sampleRate)
     , maxDelaySamples(static_cast<int>(maxDelay * sampleRate))
-    , buffer(maxDelaySamples, 0.0f)
+    , buffer(roundUpPow2(static_cast<size_t>(maxDelaySamples)), 0.0f)
+    , bufferMask(static_cast<uint32_t>(buffer.size() - 1))
     , writePos(0)
     , delayTime(0.3f)
     , feedback(0.3f)
@@ -16,6 +18,8 @@ DelayEffect::DelayEffect(int sampleRate, float maxDelay)
     , repitchRate(0.5f)
     , filterHpFreq(80.0f)
     , filterLpFreq(5000.0f)
+    , hpCoeff(0.0f)
+    , lpCoeff(0.0f)
     , hpState(0.0f)
     , lpState(0.0f)
     , modDepth(0.003f)
@@ -27,6 +31,8 @@ DelayEffect::DelayEffect(int sampleRate, float maxDelay)
     , tapeSaturation(0.3f)
 {
     slewRate = calculateSlewRate();
+    hpCoeff = onePoleCoeff(filterHpFreq);
+    lpCoeff = onePoleCoeff(filterLpFreq);
 }
 
 float DelayEffect::calculateSlewRate() const {
@@ -37,16 +43,17 @@ float DelayEffect::calculateSlewRate() const {
     return static_cast<float>(maxDelaySamples) / (maxSlewTime * static_cast<float>(sampleRate));
 }
 
+float DelayEffect::onePoleCoeff(float cutoffHz) const {
+    float cutoffNorm = cutoffHz / static_cast<float>(sampleRate);
+    return 1.0f - std::exp(-TWO_PI * cutoffNorm);
+}
+
 float DelayEffect::processFeedbackFilters(float sample) {
     // High-pass filter (removes mud/low-end buildup)
-    float hpCutoffNorm = filterHpFreq / static_cast<float>(sampleRate);
-    float hpCoeff = 1.0f - std::exp(-TWO_PI * hpCutoffNorm);
     hpState = clampSample(hpState + hpCoeff * (sample - hpState));
     float filtered = sample - hpState;
     
     // Low-pass filter (tape-like high-frequency loss)
-    float lpCutoffNorm = filterLpFreq / static_cast<float>(sampleRate);
-    float lpCoeff = 1.0f - std::exp(-TWO_PI * lpCutoffNorm);
     lpState = clampSample(lpState + lpCoeff * (filtered - lpState));
     
     // Tape-style saturation (gentle warmth)
@@ -56,77 +63,96 @@ float DelayEffect::processFeedbackFilters(float sample) {
     return result;
 }
 
-float DelayEffect::lerpRead(float delaySamples) const {
-    // Calculate read position (floating point for interpolation)
-    float readPos = static_cast<float>(writePos) - delaySamples;
-    if (readPos < 0) {
-        readPos += static_cast<float>(maxDelaySamples);
-    }
-    
-    // Integer and fractional parts for linear interpolation
-    int readPosInt = static_cast<int>(readPos);
-    float frac = readPos - static_cast<float>(readPosInt);
-    
-    // Get two adjacent samples
-    int idx0 = readPosInt % maxDelaySamples;
-    int idx1 = (readPosInt + 1) % maxDelaySamples;
+float DelayEffect::lerpRead(int writeIndex, float delaySamples) const {
+    // Split the delay into whole samples and a fraction: the read point
+    // lies between the samples delayInt and delayInt + 1 behind the write
+    // position. The line's length is a power of two, so both indices wrap
+    // with a mask instead of a division or a branch.
+    int delayInt = static_cast<int>(delaySamples);
+    float frac = delaySamples - static_cast<float>(delayInt);
+    uint32_t newer = static_cast<uint32_t>(writeIndex - delayInt) & bufferMask;
+    uint32_t older = (newer - 1) & bufferMask;
     
     // Linear interpolation between samples
-    return buffer[idx0] * (1.0f - frac) + buffer[idx1] * frac;
+    return buffer[newer] * (1.0f - frac) + buffer[older] * frac;
 }
 
 void DelayEffect::process(const float* input, float* output, int numSamples) {
-    float targetDelaySamples = delayTime * static_cast<float>(sampleRate);
+    // Everything that only changes between blocks is computed once here
+    // rather than per sample
+    const float fs = static_cast<float>(sampleRate);
+    const float targetDelaySamples = delayTime * fs;
+    const bool instantSlew = std::isinf(slewRate);
+    const float slew = slewRate;
+    const float modCyclesPerSample = modRate / fs;
+    const float modScale = modDepth * fs;
+    const float flutterCyclesPerSample = flutterRate / fs;
+    const float flutterScale = flutterDepth * fs;
+    const float maxReadDelay = static_cast<float>(maxDelaySamples - 2);
+    const float fb = feedback;
+    const float wet = dryWet;
+    const float dry = 1.0f - dryWet;
+    
+    // Loop-carried state lives in locals for the block (the output and
+    // delay-line stores could otherwise alias the members)
+    float delaySamples = currentDelaySamples;
+    float modPos = modPhase;
+    float flutterPos = flutterPhase;
+    int writeIndex = writePos;
+    float* line = buffer.data();
     
     for (int i = 0; i < numSamples; ++i) {
         // Analog behavior: smoothly slew toward target delay time
-        if (std::isinf(slewRate)) {
-            currentDelaySamples = targetDelaySamples;
+        if (instantSlew) {
+            delaySamples = targetDelaySamples;
         } else {
-            float diff = targetDelaySamples - currentDelaySamples;
-            if (std::abs(diff) > slewRate) {
-                currentDelaySamples += (diff > 0) ? slewRate : -slewRate;
+            float diff = targetDelaySamples - delaySamples;
+            if (std::abs(diff) > slew) {
+                delaySamples += (diff > 0) ? slew : -slew;
             } else {
-                currentDelaySamples = targetDelaySamples;
+                delaySamples = targetDelaySamples;
             }
         }
         
         // Add tape wobble and flutter modulation
-        float mod = std::sin(TWO_PI * modRate * modPhase / static_cast<float>(sampleRate));
-        float modSamples = modDepth * static_cast<float>(sampleRate) * mod;
-        
-        float flutter = std::sin(TWO_PI * flutterRate * flutterPhase / static_cast<float>(sampleRate));
-        float flutterSamples = flutterDepth * static_cast<float>(sampleRate) * flutter;
+        float modSamples = modScale * SINE_TABLE(modCyclesPerSample * modPos);
+        float flutterSamples = flutterScale * SINE_TABLE(flutterCyclesPerSample * flutterPos);
         
-        float totalDelaySamples = currentDelaySamples + modSamples + flutterSamples;
-        totalDelaySamples = std::clamp(totalDelaySamples, 1.0f, static_cast<float>(maxDelaySamples - 2));
+        float totalDelaySamples = delaySamples + modSamples + flutterSamples;
+        totalDelaySamples = std::clamp(totalDelaySamples, 1.0f, maxReadDelay);
         
         // Advance modulation phases
-        modPhase += 1.0f;
-        if (modPhase >= static_cast<float>(sampleRate)) {
-            modPhase = 0.0f;
+        modPos += 1.0f;
+        if (modPos >= fs) {
+            modPos = 0.0f;
         }
         
-        flutterPhase += 1.0f;
-        if (flutterPhase >= static_cast<float>(sampleRate)) {
-            flutterPhase = 0.0f;
+        flutterPos += 1.0f;
+        if (flutterPos >= fs) {
+            flutterPos = 0.0f;
         }
         
         // Read from delay buffer with interpolation
-        float delayed = lerpRead(totalDelaySamples);
+        float delayed = lerpRead(writeIndex, totalDelaySamples);
         
         // Process feedback through filters
         float feedbackSignal = processFeedbackFilters(delayed);
         
+        // Mix dry and wet (before the write, in case output aliases input)
+        float dryIn = input[i];
+        output[i] = dryIn * dry + delayed * wet;
+        
         // Write to buffer
-        buffer[writePos] = clampSample(input[i] + feedbackSignal * feedback);
+        line[writeIndex] = clampSample(dryIn + feedbackSignal * fb);
         
         // Advance write position
-        writePos = (writePos + 1) % maxDelaySamples;
-        
-        // Mix dry and wet
-        output[i] = input[i] * (1.0f - dryWet) + delayed * dryWet;
+        writeIndex = (writeIndex + 1) & static_cast<int>(bufferMask);
     }
+    
+    currentDelaySamples = delaySamples;
+    modPhase = modPos;
+    flutterPhase = flutterPos;
+    writePos = writeIndex;
 }
 
 void DelayEffect::setDelayTime(float timeSeconds) {
@@ -7,6 +7,11 @@ namespace DubSiren {
 // Decay scale factor: -ln(0.01) for reaching 99% of target
 constexpr float DECAY_SCALE = 4.605f;
 
+// Released envelope level treated as silent. Far below the 0.001 level at
+// which the engine already gates its output, so snapping to zero here is
+// inaudible.
+constexpr float SILENCE_LEVEL = 1.0e-6f;
+
 Envelope::Envelope(int sampleRate)
     : sampleRate(sampleRate)
     , attackTime(0.01f)    // 10ms default attack
@@ -28,9 +33,27 @@ void Envelope::updateCoefficients() {
 }
 
 void Envelope::generate(float* output, int numSamples) {
+    // Gate, target and coefficient are read once per block (a trigger or
+    // release landing mid-block takes effect at the next block), leaving a
+    // loop with no atomic load or branch and the value held in a register
+    const bool attacking = active.load(std::memory_order_acquire);
+    const float target = attacking ? 1.0f : 0.0f;
+    const float coeff = attacking ? attackCoeff : releaseCoeff;
+    float value = currentValue;
+    
+    // Released and fully decayed: emit silence without iterating, and
+    // settle at exactly zero instead of decaying into denormals
+    if (!attacking && value < SILENCE_LEVEL) {
+        currentValue = 0.0f;
+        std::fill(output, output + numSamples, 0.0f);
+        return;
+    }
+    
     for (int i = 0; i < numSamples; ++i) {
-        output[i] = generateSample();
+        value += (target - value) * coeff;
+        output[i] = value;
     }
+    currentValue = value;
 }
 
 float Envelope::generateSample() {
@@ -4,6 +4,20 @@
 
 namespace DubSiren {
 
+namespace {
+
+// One-pole coefficient dt / (RC + dt), with RC = 1 / (2*pi*fc) and
+// dt = 1 / fs, rearranged as w / (w + fs) so it costs a single division.
+// Resonance then scales it up: Q 0.1-20 maps to 1x-3x, capped at 0.99.
+inline float onePoleAlpha(float cutoffHz, float resonanceQ, float sampleRate) {
+    float w = TWO_PI * cutoffHz;
+    float alpha = w / (w + sampleRate);
+    float resonanceFactor = (resonanceQ - 0.1f) * (1.0f / 19.9f);  // Normalize to 0.0-1.0
+    return std::min(alpha * (1.0f + resonanceFactor * 2.0f), 0.99f);
+}
+
+} // anonymous namespace
+
 // ============================================================================
 // LowPassFilter Implementation
 // ============================================================================
@@ -20,9 +34,27 @@ LowPassFilter::LowPassFilter(int sampleRate)
 }
 
 void LowPassFilter::process(const float* input, float* output, int numSamples) {
+    // Work on local copies of the state: as far as the compiler knows,
+    // output may alias the members, which would force every update back
+    // to memory
+    const float targetCutoff = cutoff;
+    const float targetResonance = resonance;
+    const float fs = static_cast<float>(sampleRate);
+    float cut = cutoffCurrent;
+    float res = resonanceCurrent;
+    float prev = prevOutput;
+    
     for (int i = 0; i < numSamples; ++i) {
-        output[i] = processSample(input[i]);
+        cut += (targetCutoff - cut) * smoothing;
+        res += (targetResonance - res) * smoothing;
+        float alpha = onePoleAlpha(cut, res, fs);
+        output[i] = prev + alpha * (input[i] - prev);
+        prev = clampSample(output[i]);
     }
+    
+    cutoffCurrent = cut;
+    resonanceCurrent = res;
+    prevOutput = prev;
 }
 
 float LowPassFilter::processSample(float input) {
@@ -30,16 +62,8 @@ float LowPassFilter::processSample(float input) {
     cutoffCurrent += (cutoff - cutoffCurrent) * smoothing;
     resonanceCurrent += (resonance - resonanceCurrent) * smoothing;
     
-    // Calculate filter coefficient with smoothed cutoff
-    float rc = 1.0f / (TWO_PI * cutoffCurrent);
-    float dt = 1.0f / static_cast<float>(sampleRate);
-    float alpha = dt / (rc + dt);
-    
-    // Add resonance (feedback)
-    // Scale Q value (0.1-20) to reasonable feedback range
-    float resonanceFactor = (resonanceCurrent - 0.1f) / 19.9f;  // Normalize to 0.0-1.0
-    alpha = alpha * (1.0f + resonanceFactor * 2.0f);
-    alpha = std::min(alpha, 0.99f);
+    // Calculate filter coefficient with smoothed cutoff and resonance
+    float alpha = onePoleAlpha(cutoffCurrent, resonanceCurrent, static_cast<float>(sampleRate));
     
     float output = prevOutput + alpha * (input - prevOutput);
     
@@ -1,10 +1,46 @@
 #include "DSP/LFO.h"
+#include "DSP/SineTable.h"
 #include <cmath>
 
 namespace DubSiren {
 
+namespace {
+
+// Waveform shapes over one cycle (phase 0.0 to 1.0), output -1.0 to 1.0
+inline float sineShape(float phase) {
+    return SINE_TABLE(phase);
+}
+
+inline float squareShape(float phase) {
+    return (phase < 0.5f) ? 1.0f : -1.0f;
+}
+
+inline float sawShape(float phase) {
+    return 2.0f * phase - 1.0f;
+}
+
+inline float triangleShape(float phase) {
+    return (phase < 0.5f) ? 4.0f * phase - 1.0f : 3.0f - 4.0f * phase;
+}
+
+// Fill a block with one shape, returning the advanced phase
+template <typename Shape>
+inline float fillBlock(float* output, int numSamples, float phase, float dt, float depth, Shape shape) {
+    for (int i = 0; i < numSamples; ++i) {
+        output[i] = shape(phase) * depth;
+        phase += dt;
+        if (phase >= 1.0f) {
+            phase -= 1.0f;
+        }
+    }
+    return phase;
+}
+
+} // anonymous namespace
+
 LFO::LFO(int sampleRate)
     : sampleRate(sampleRate)
+    , invSampleRate(1.0f / static_cast<float>(sampleRate))
     , frequency(5.0f)    // 5 Hz default rate
     , phase(0.0f)
     , waveform(Waveform::Sine)
@@ -13,39 +49,46 @@ LFO::LFO(int sampleRate)
 }
 
 void LFO::generate(float* output, int numSamples) {
-    for (int i = 0; i < numSamples; ++i) {
-        output[i] = generateSample();
+    // Rate, depth and waveform only change between blocks: choose the
+    // shape once and run a switch-free loop for it
+    const float dt = frequency * invSampleRate;
+    
+    switch (waveform) {
+        case Waveform::Sine:
+            phase = fillBlock(output, numSamples, phase, dt, depth, sineShape);
+            break;
+        case Waveform::Square:
+            phase = fillBlock(output, numSamples, phase, dt, depth, squareShape);
+            break;
+        case Waveform::Saw:
+            phase = fillBlock(output, numSamples, phase, dt, depth, sawShape);
+            break;
+        case Waveform::Triangle:
+            phase = fillBlock(output, numSamples, phase, dt, depth, triangleShape);
+            break;
     }
 }
 
 float LFO::generateSample() {
     float value = 0.0f;
-    float dt = frequency / static_cast<float>(sampleRate);
     
     switch (waveform) {
         case Waveform::Sine:
-            value = std::sin(TWO_PI * phase);
+            value = sineShape(phase);
             break;
-            
         case Waveform::Square:
-            value = (phase < 0.5f) ? 1.0f : -1.0f;
+            value = squareShape(phase);
             break;
-            
         case Waveform::Saw:
-            value = 2.0f * phase - 1.0f;
+            value = sawShape(phase);
             break;
-            
         case Waveform::Triangle:
-            if (phase < 0.5f) {
-                value = 4.0f * phase - 1.0f;
-            } else {
-                value = 3.0f - 4.0f * phase;
-            }
+            value = triangleShape(phase);
             break;
     }
     
     // Advance phase
-    phase += dt;
+    phase += frequency * invSampleRate;
     if (phase >= 1.0f) {
         phase -= 1.0f;
     }
@@ -1,10 +1,12 @@
 #include "DSP/Oscillator.h"
+#include "DSP/SineTable.h"
 #include <cmath>
 
 namespace DubSiren {
 
 Oscillator::Oscillator(int sampleRate)
     : sampleRate(sampleRate)
+    , invSampleRate(1.0f / static_cast<float>(sampleRate))
     , frequency(440.0f)
     , phase(0.0f)
     , waveform(Waveform::Sine)
@@ -18,6 +20,9 @@ void Oscillator::generate(float* output, int numSamples) {
 }
 
 float Oscillator::generateSample() {
+    // Phase increment per sample, shared by the PolyBLEP correction and
+    // the phase advance
+    float dt = frequency * invSampleRate;
     float sample = 0.0f;
     
     switch (waveform) {
@@ -25,10 +30,10 @@ float Oscillator::generateSample() {
             sample = generateSine();
             break;
         case Waveform::Square:
-            sample = generateSquarePolyBlep();
+            sample = generateSquarePolyBlep(dt);
             break;
         case Waveform::Saw:
-            sample = generateSawPolyBlep();
+            sample = generateSawPolyBlep(dt);
             break;
         case Waveform::Triangle:
             sample = generateTriangle();
@@ -36,7 +41,6 @@ float Oscillator::generateSample() {
     }
     
     // Advance phase
-    float dt = frequency / static_cast<float>(sampleRate);
     phase += dt;
     if (phase >= 1.0f) {
         phase -= 1.0f;
@@ -73,17 +77,16 @@ float Oscillator::polyBlep(float t, float dt) const {
 
 float Oscillator::generateSine() {
     // Sine wave - naturally band-limited, no anti-aliasing needed
-    return std::sin(TWO_PI * phase);
+    return SINE_TABLE(phase);
 }
 
-float Oscillator::generateSquarePolyBlep() {
+float Oscillator::generateSquarePolyBlep(float dt) {
     /**
      * Generate square wave with PolyBLEP anti-aliasing.
      * 
      * PolyBLEP is applied at both transitions (0->1 at phase=0, 1->0 at phase=0.5)
      * to smooth the discontinuities and reduce aliasing.
      */
-    float dt = frequency / static_cast<float>(sampleRate);
     
     // Naive square wave: +1 for first half, -1 for second half
     float value = (phase < 0.5f) ? 1.0f : -1.0f;
@@ -101,14 +104,13 @@ float Oscillator::generateSquarePolyBlep() {
     return value;
 }
 
-float Oscillator::generateSawPolyBlep() {
+float Oscillator::generateSawPolyBlep(float dt) {
     /**
      * Generate sawtooth wave with PolyBLEP anti-aliasing.
      * 
      * PolyBLEP is applied at the phase reset (when saw jumps from +1 to -1)
      * to smooth the discontinuity and reduce aliasing.
      */
-    float dt = frequency / static_cast<float>(sampleRate);
     
     // Naive sawtooth: ramps from -1 to +1 over one cycle
     float value = 2.0f * phase - 1.0f;
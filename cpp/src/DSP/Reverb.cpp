@@ -9,7 +9,7 @@ namespace DubSiren {
 // ============================================================================
 
 void ReverbEffect::Biquad::setLowpass(float freq, float q, float sampleRate) {
-    float omega = 2.0f * M_PI * freq / sampleRate;
+    float omega = freqToOmega(freq, sampleRate);
     float cosOmega = std::cos(omega);
     float sinOmega = std::sin(omega);
     float alpha = sinOmega / (2.0f * q);
@@ -23,7 +23,7 @@ void ReverbEffect::Biquad::setLowpass(float freq, float q, float sampleRate) {
 }
 
 void ReverbEffect::Biquad::setBandpass(float freq, float q, float sampleRate) {
-    float omega = 2.0f * M_PI * freq / sampleRate;
+    float omega = freqToOmega(freq, sampleRate);
     float cosOmega = std::cos(omega);
     float sinOmega = std::sin(omega);
     float alpha = sinOmega / (2.0f * q);
@@ -37,7 +37,7 @@ void ReverbEffect::Biquad::setBandpass(float freq, float q, float sampleRate) {
 }
 
 void ReverbEffect::Biquad::setHighpass(float freq, float q, float sampleRate) {
-    float omega = 2.0f * M_PI * freq / sampleRate;
+    float omega = freqToOmega(freq, sampleRate);
     float cosOmega = std::cos(omega);
     float sinOmega = std::sin(omega);
     float alpha = sinOmega / (2.0f * q);
@@ -66,6 +66,14 @@ float ReverbEffect::Biquad::process(float input) {
     return output;
 }
 
+void ReverbEffect::Biquad::copyCoefficients(const Biquad& other) {
+    b0 = other.b0;
+    b1 = other.b1;
+    b2 = other.b2;
+    a1 = other.a1;
+    a2 = other.a2;
+}
+
 void ReverbEffect::Biquad::reset() {
     x1 = x2 = y1 = y2 = 0.0f;
 }
@@ -74,9 +82,9 @@ void ReverbEffect::Biquad::reset() {
 // Spring Line Implementation
 // ============================================================================
 
-void ReverbEffect::SpringLine::init(int length, float sampleRate, int springIndex) {
+void ReverbEffect::SpringLine::init(float* buffer, int length, float sampleRate, int springIndex) {
+    delayBuffer = buffer;
     delayLength = length;
-    delayBuffer.resize(length, 0.0f);
     writeIndex = 0;
     feedback = 0.85f;  // Default, will be updated
 
@@ -143,7 +151,9 @@ float ReverbEffect::SpringLine::process(float input) {
     }
 
     // Advance write position
-    writeIndex = (writeIndex + 1) % delayLength;
+    if (++writeIndex == delayLength) {
+        writeIndex = 0;
+    }
 
     return modal;  // Return the modally-enhanced output
 }
@@ -152,9 +162,9 @@ float ReverbEffect::SpringLine::process(float input) {
 // Allpass Filter Implementation
 // ============================================================================
 
-void ReverbEffect::AllpassFilter::init(int size) {
+void ReverbEffect::AllpassFilter::init(float* storage, int size) {
+    buffer = storage;
     bufferSize = size;
-    buffer.resize(size, 0.0f);
     index = 0;
 }
 
@@ -170,7 +180,9 @@ float ReverbEffect::AllpassFilter::process(float input) {
         buffer[index] = 0.0f;
     }
 
-    index = (index + 1) % bufferSize;
+    if (++index == bufferSize) {
+        index = 0;
+    }
 
     return output;
 }
@@ -190,19 +202,36 @@ ReverbEffect::ReverbEffect(int sampleRate)
 {
     // Scale delay lengths for sample rate
     float scale = static_cast<float>(sampleRate) / 48000.0f;
+    int springLengths[NUM_SPRINGS];
+    int allpassLengths[NUM_ALLPASS];
+    size_t totalLength = 0;
+    for (int i = 0; i < NUM_SPRINGS; ++i) {
+        springLengths[i] = static_cast<int>(SPRING_LENGTHS[i] * scale);
+        totalLength += 2 * springLengths[i] + STEREO_SPREAD;
+    }
+    for (int i = 0; i < NUM_ALLPASS; ++i) {
+        allpassLengths[i] = static_cast<int>(ALLPASS_LENGTHS[i] * scale);
+        totalLength += 2 * allpassLengths[i] + STEREO_SPREAD;
+    }
+    lineMemory.assign(totalLength, 0.0f);
+    float* line = lineMemory.data();
 
-    // Initialize spring lines (left channel)
+    // Initialize spring lines, each L/R pair adjacent in memory
     for (int i = 0; i < NUM_SPRINGS; ++i) {
-        int len = static_cast<int>(SPRING_LENGTHS[i] * scale);
-        springsL[i].init(len, sampleRate, i);
-        springsR[i].init(len + STEREO_SPREAD, sampleRate, i);  // Offset for stereo
+        int len = springLengths[i];
+        springsL[i].init(line, len, sampleRate, i);
+        line += len;
+        springsR[i].init(line, len + STEREO_SPREAD, sampleRate, i);  // Offset for stereo
+        line += len + STEREO_SPREAD;
     }
 
     // Initialize allpass filters for diffusion
     for (int i = 0; i < NUM_ALLPASS; ++i) {
-        int len = static_cast<int>(ALLPASS_LENGTHS[i] * scale);
-        allpassL[i].init(len);
-        allpassR[i].init(len + STEREO_SPREAD);
+        int len = allpassLengths[i];
+        allpassL[i].init(line, len);
+        line += len;
+        allpassR[i].init(line, len + STEREO_SPREAD);
+        line += len + STEREO_SPREAD;
     }
 
     // Initialize input transducer (lowpass ~4kHz, models mechanical bandwidth)
@@ -212,10 +241,11 @@ ReverbEffect::ReverbEffect(int sampleRate)
     outputLowcut.setHighpass(80.0f, 0.7f, sampleRate);
     outputHighcut.setLowpass(6000.0f, 0.7f, sampleRate);
 
-    updateCoefficients();
+    updateFeedback();
+    updateDamping();
 }
 
-void ReverbEffect::updateCoefficients() {
+void ReverbEffect::updateFeedback() {
     // Update spring feedback based on decay parameter
     // Higher decay = longer reverb tail
     // Reduced range to prevent feedback loops when combined with delay
@@ -226,15 +256,31 @@ void ReverbEffect::updateCoefficients() {
         // Slightly different feedback for each spring to avoid buildup
         springsL[i].feedback = feedbackAmount * (0.92f + i * 0.015f);
         springsR[i].feedback = feedbackAmount * (0.92f + i * 0.015f);
+    }
+}
 
-        // Update damping filter based on damping parameter
-        float dampFreq = 2000.0f + (1.0f - damping) * 4000.0f;  // 2kHz - 6kHz
-        springsL[i].dampingFilter.setLowpass(dampFreq, 0.7f, sampleRate);
-        springsR[i].dampingFilter.setLowpass(dampFreq, 0.7f, sampleRate);
+void ReverbEffect::updateDamping() {
+    // Every spring shares the same damping response, so the coefficients
+    // are computed once and copied (the filters keep their own state)
+    float dampFreq = 2000.0f + (1.0f - damping) * 4000.0f;  // 2kHz - 6kHz
+    Biquad lowpass;
+    lowpass.setLowpass(dampFreq, 0.7f, sampleRate);
+
+    for (int i = 0; i < NUM_SPRINGS; ++i) {
+        springsL[i].dampingFilter.copyCoefficients(lowpass);
+        springsR[i].dampingFilter.copyCoefficients(lowpass);
     }
 }
 
 void ReverbEffect::process(const float* input, float* output, int numSamples) {
+    // One pass over the block: each input sample is transduced once and fed
+    // to every spring line of both channels. Block-rate gains are read once.
+    // The signal path after the springs is linear, so averaging the springs
+    // and the L+R downmix are folded into the wet gain instead of being
+    // applied per sample.
+    const float wetGain = wet * OUTPUT_GAIN * (0.5f / NUM_SPRINGS);
+    const float dryGain = dry;
+
     for (int i = 0; i < numSamples; ++i) {
         float inSample = input[i];
 
@@ -251,10 +297,6 @@ void ReverbEffect::process(const float* input, float* output, int numSamples) {
             springOutR += springsR[s].process(transduced);
         }
 
-        // Average the spring outputs
-        springOutL /= NUM_SPRINGS;
-        springOutR /= NUM_SPRINGS;
-
         // Apply diffusion (series allpass filters)
         for (int a = 0; a < NUM_ALLPASS; ++a) {
             springOutL = allpassL[a].process(springOutL);
@@ -267,17 +309,10 @@ void ReverbEffect::process(const float* input, float* output, int numSamples) {
         springOutR = outputLowcut.process(springOutR);
         springOutR = outputHighcut.process(springOutR);
 
-        // Stereo width control
-        float mid = (springOutL + springOutR) * 0.5f;
-        float side = (springOutL - springOutR) * 0.5f * width;
-        springOutL = mid + side;
-        springOutR = mid - side;
-
-        // Mix wet/dry (output is mono, so average L+R)
-        float wetMix = (springOutL + springOutR) * 0.5f * wet * OUTPUT_GAIN;
-        float dryMix = inSample * dry;
-
-        float finalOut = wetMix + dryMix;
+        // Mix wet/dry. The output is mono, so the wet signal is the mid
+        // channel: the stereo width stage (mid +/- side) cancels in the
+        // L+R downmix and is skipped here.
+        float finalOut = (springOutL + springOutR) * wetGain + inSample * dryGain;
 
         // Safety limiter to prevent clipping from feedback loops
         if (finalOut > 1.0f) finalOut = 1.0f;
@@ -289,7 +324,7 @@ void ReverbEffect::process(const float* input, float* output, int numSamples) {
 
 void ReverbEffect::setSize(float size) {
     springDecay = std::clamp(size, 0.0f, 1.0f);
-    updateCoefficients();
+    updateFeedback();
 }
 
 void ReverbEffect::setDryWet(float mix) {
@@ -299,7 +334,7 @@ void ReverbEffect::setDryWet(float mix) {
 
 void ReverbEffect::setDamping(float damp) {
     damping = std::clamp(damp, 0.0f, 1.0f);
-    updateCoefficients();
+    updateDamping();
 }
 
 void ReverbEffect::setWidth(float w) {
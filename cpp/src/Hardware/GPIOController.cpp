@@ -1,8 +1,11 @@
 #include "Hardware/GPIOController.h"
+#include "Realtime.h"
 #include <iostream>
 #include <cstring>
-#include <vector>
 #include <algorithm>
+#include <csignal>
+#include <spawn.h>
+#include <unistd.h>
 
 #ifdef HAVE_GPIOD
 #include <gpiod.h>
@@ -10,14 +13,44 @@
 
 #ifdef HAVE_PIGPIO
 #include <pigpio.h>
+#include "Audio/RingBuffer.h"
+#endif
+
+#if defined(HAVE_GPIOD) || defined(HAVE_PIGPIO)
+#include <cerrno>
+#include <poll.h>
+#include <sys/eventfd.h>
 #endif
 
 namespace DubSiren {
 
 // ============================================================================
-// DEBUG: Set to 1 to enable verbose input logging for testing
+// DEBUG: Set to 1 (e.g. -DDEBUG_INPUTS=1) to enable verbose input logging
 // ============================================================================
-#define DEBUG_INPUTS 1
+#ifndef DEBUG_INPUTS
+#define DEBUG_INPUTS 0
+#endif
+
+// Minimum interval between encoder value printouts; a fast spin otherwise
+// writes a line to stdout on every detent
+constexpr auto ENCODER_LOG_INTERVAL = std::chrono::milliseconds(100);
+
+// Input sampling interval where edge events are not available (simulation)
+constexpr auto POLLED_INPUT_INTERVAL = std::chrono::milliseconds(1);
+
+// Minimum interval between applying coalesced encoder changes to the engine
+constexpr auto PARAM_FLUSH_INTERVAL = std::chrono::milliseconds(10);
+
+// Formatters for events posted from the input thread (run on the logger thread)
+void formatParamChange(std::ostream& os, const LogEvent& event) {
+    os << "[Bank " << (event.code == static_cast<int>(Bank::A) ? "A" : "B") << "] "
+       << event.text << ": " << event.values[0];
+}
+
+void formatWaveformChange(std::ostream& os, const LogEvent& event) {
+    os << "[Bank " << (event.code == static_cast<int>(Bank::A) ? "A" : "B") << "] "
+       << event.text << ": " << WAVEFORM_NAMES[static_cast<int>(event.values[0])];
+}
 
 // ============================================================================
 // Platform-specific GPIO helpers
@@ -25,30 +58,83 @@ namespace DubSiren {
 
 namespace {
 
-bool gpioInitialized = false;
+#if defined(HAVE_GPIOD) || defined(HAVE_PIGPIO)
+// Encoder lines, flattened from GPIO::ENCODER_PINS so the lines requested
+// and filtered here are always the ones the encoders decode
+constexpr size_t NUM_ENCODER_LINES = sizeof(GPIO::ENCODER_PINS) / sizeof(GPIO::ENCODER_PINS[0][0]);
+
+constexpr std::array<unsigned int, NUM_ENCODER_LINES> encoderLines() {
+    std::array<unsigned int, NUM_ENCODER_LINES> lines{};
+    size_t n = 0;
+    for (const auto& pair : GPIO::ENCODER_PINS) {
+        for (int pin : pair) lines[n++] = static_cast<unsigned int>(pin);
+    }
+    return lines;
+}
+
+constexpr std::array<unsigned int, NUM_ENCODER_LINES> ENCODER_LINES = encoderLines();
+
+// Encoder lines get a debounce filter (kernel debounce on libgpiod, the
+// glitch filter on pigpio) so contact bounce never wakes the input thread.
+// Kept well below the ~1 ms edge spacing of a fast spin.
+constexpr unsigned long ENCODER_DEBOUNCE_US = 500;
+
+// Buttons and the pitch switch bounce for several milliseconds; filtering
+// them below us means only settled transitions reach the software debounce
+// instead of a burst of wakeups per press
+constexpr unsigned int SWITCH_LINES[] = {
+    GPIO::TRIGGER_BTN, GPIO::SHIFT_BTN, GPIO::SHUTDOWN_BTN,
+    GPIO::PITCH_ENV_UP, GPIO::PITCH_ENV_DOWN
+};
+constexpr size_t NUM_SWITCH_LINES = sizeof(SWITCH_LINES) / sizeof(SWITCH_LINES[0]);
+constexpr unsigned long SWITCH_DEBOUNCE_US = 5000;
+#endif
 
 #ifdef HAVE_GPIOD
+bool gpioInitialized = false;
 struct gpiod_chip* gpioChip = nullptr;
 struct gpiod_line_request* lineRequest = nullptr;
+struct gpiod_edge_event_buffer* edgeEvents = nullptr;
+int wakeFd = -1;  // eventfd that interrupts waitForEdges() on stop
 
-// All GPIO pins we need to monitor
-const unsigned int ALL_PINS[] = {
-    2, 3, 4, 9, 10, 13, 14, 15, 17, 20, 22, 23, 24, 26, 27
-};
-const size_t NUM_PINS = sizeof(ALL_PINS) / sizeof(ALL_PINS[0]);
+// Edge events read per call; anything beyond this is picked up next wakeup
+constexpr size_t EDGE_EVENT_CAPACITY = 64;
 
-// Lookup table: maps GPIO number -> index in ALL_PINS (-1 if not used)
-// Max GPIO on Pi is 27, so array of 28 elements
-int gpioToLineIndex[28] = {-1};
+// All GPIO pins we need to monitor, built from the two groups at compile
+// time so there is no separate list of pin numbers to keep in sync
+constexpr size_t NUM_PINS = NUM_ENCODER_LINES + NUM_SWITCH_LINES;
 
-bool initPlatformGPIO() {
-    if (gpioInitialized) return true;
-    
-    // Initialize GPIO-to-line-index lookup table
-    for (int i = 0; i < 28; ++i) gpioToLineIndex[i] = -1;
+constexpr std::array<unsigned int, NUM_PINS> allPins() {
+    std::array<unsigned int, NUM_PINS> pins{};
+    for (size_t i = 0; i < NUM_ENCODER_LINES; ++i) pins[i] = ENCODER_LINES[i];
+    for (size_t i = 0; i < NUM_SWITCH_LINES; ++i) pins[NUM_ENCODER_LINES + i] = SWITCH_LINES[i];
+    return pins;
+}
+
+constexpr std::array<unsigned int, NUM_PINS> ALL_PINS = allPins();
+
+// Line levels, one bit per GPIO (1 = high), seeded once at init and then
+// kept current from edge events. Reads come from here rather than a fresh
+// ioctl, so a device always sees the level of the edge that woke it - not
+// whatever a bouncing contact reads a moment later. Only touched by the
+// thread that calls waitForEdges() (and by start() before it runs).
+uint32_t levelShadow = ~0u;
+
+void seedLevelShadow() {
+    enum gpiod_line_value values[NUM_PINS];
+    if (gpiod_line_request_get_values_subset(lineRequest, NUM_PINS, ALL_PINS.data(), values) < 0) {
+        return;
+    }
+    levelShadow = ~0u;
     for (size_t i = 0; i < NUM_PINS; ++i) {
-        gpioToLineIndex[ALL_PINS[i]] = static_cast<int>(i);
+        if (values[i] != GPIOD_LINE_VALUE_ACTIVE) {
+            levelShadow &= ~(1u << ALL_PINS[i]);
+        }
     }
+}
+
+bool initPlatformGPIO() {
+    if (gpioInitialized) return true;
     
     gpioChip = gpiod_chip_open("/dev/gpiochip0");
     if (!gpioChip) {
@@ -60,9 +146,16 @@ bool initPlatformGPIO() {
     struct gpiod_line_settings* settings = gpiod_line_settings_new();
     gpiod_line_settings_set_direction(settings, GPIOD_LINE_DIRECTION_INPUT);
     gpiod_line_settings_set_bias(settings, GPIOD_LINE_BIAS_PULL_UP);
+    gpiod_line_settings_set_edge_detection(settings, GPIOD_LINE_EDGE_BOTH);
     
     struct gpiod_line_config* config = gpiod_line_config_new();
-    gpiod_line_config_add_line_settings(config, ALL_PINS, NUM_PINS, settings);
+    gpiod_line_config_add_line_settings(config, ALL_PINS.data(), NUM_PINS, settings);
+    
+    // Later settings override earlier ones for the same offsets
+    gpiod_line_settings_set_debounce_period_us(settings, ENCODER_DEBOUNCE_US);
+    gpiod_line_config_add_line_settings(config, ENCODER_LINES.data(), NUM_ENCODER_LINES, settings);
+    gpiod_line_settings_set_debounce_period_us(settings, SWITCH_DEBOUNCE_US);
+    gpiod_line_config_add_line_settings(config, SWITCH_LINES, NUM_SWITCH_LINES, settings);
     
     struct gpiod_request_config* reqConfig = gpiod_request_config_new();
     gpiod_request_config_set_consumer(reqConfig, "dubsiren");
@@ -80,12 +173,24 @@ bool initPlatformGPIO() {
         return false;
     }
     
+    edgeEvents = gpiod_edge_event_buffer_new(EDGE_EVENT_CAPACITY);
+    wakeFd = eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC);
+    seedLevelShadow();
+    
     gpioInitialized = true;
     std::cout << "libgpiod initialized successfully (" << NUM_PINS << " pins)" << std::endl;
     return true;
 }
 
 void cleanupPlatformGPIO() {
+    if (wakeFd >= 0) {
+        close(wakeFd);
+        wakeFd = -1;
+    }
+    if (edgeEvents) {
+        gpiod_edge_event_buffer_free(edgeEvents);
+        edgeEvents = nullptr;
+    }
     if (lineRequest) {
         gpiod_line_request_release(lineRequest);
         lineRequest = nullptr;
@@ -97,49 +202,221 @@ void cleanupPlatformGPIO() {
     gpioInitialized = false;
 }
 
-int readPin(int pin) {
-    if (!lineRequest) return 1;
-    if (pin < 0 || pin > 27) return 1;
+void setupInputPin(int pin) {
+    // Direction, pull-up and edge detection are set for every line when
+    // they are requested in initPlatformGPIO()
+    (void)pin;
+}
 
-    // Verify GPIO is in our requested set
-    int lineIndex = gpioToLineIndex[pin];
-    if (lineIndex < 0) return 1;  // GPIO not in our requested set
+// Lines outside the requested set stay high, i.e. read as released
+uint32_t readLevels() {
+    return levelShadow;
+}
 
-    // Read using GPIO pin number (libgpiod uses chip offsets, not array indices)
-    int value = gpiod_line_request_get_value(lineRequest, static_cast<unsigned int>(pin));
+// Block until an edge arrives on any requested line, wakeEdgeWait() is
+// called, or the timeout expires (negative = wait indefinitely). Edges are
+// then drained - every pending event, not just one buffer's worth - applying
+// each to the level shadow and calling onEdge(lineBit, levels) right after
+// it, so the caller sees every intermediate level. Returns the number of events
+// read, 0 on timeout or wake, or -1 on error.
+template<typename OnEdge>
+int waitForEdges(int64_t timeoutNs, OnEdge&& onEdge) {
+    if (!lineRequest || !edgeEvents || wakeFd < 0) return -1;
+    
+    struct pollfd fds[2] = {
+        {gpiod_line_request_get_fd(lineRequest), POLLIN, 0},
+        {wakeFd, POLLIN, 0}
+    };
+    struct timespec timeout = {
+        static_cast<time_t>(timeoutNs / 1000000000),
+        static_cast<long>(timeoutNs % 1000000000)
+    };
+    int ret = ppoll(fds, 2, timeoutNs < 0 ? nullptr : &timeout, nullptr);
+    if (ret < 0) return errno == EINTR ? 0 : -1;
+    
+    if (fds[1].revents & POLLIN) {
+        uint64_t count;
+        ssize_t unused = read(wakeFd, &count, sizeof(count));
+        (void)unused;
+    }
+    if (!(fds[0].revents & POLLIN)) return 0;
+    
+    int total = 0;
+    while (true) {
+        int count = gpiod_line_request_read_edge_events(lineRequest, edgeEvents, EDGE_EVENT_CAPACITY);
+        if (count < 0) return -1;
+        for (int i = 0; i < count; ++i) {
+            struct gpiod_edge_event* event = gpiod_edge_event_buffer_get_event(edgeEvents, i);
+            uint32_t bit = 1u << gpiod_edge_event_get_line_offset(event);
+            if (gpiod_edge_event_get_event_type(event) == GPIOD_EDGE_EVENT_RISING_EDGE) {
+                levelShadow |= bit;
+            } else {
+                levelShadow &= ~bit;
+            }
+            onEdge(bit, levelShadow);
+        }
+        total += count;
+        
+        // A partial buffer means the queue is empty; a full one may have more
+        // behind it, which a zero-timeout wait reports without blocking
+        if (static_cast<size_t>(count) < EDGE_EVENT_CAPACITY ||
+            gpiod_line_request_wait_edge_events(lineRequest, 0) <= 0) {
+            break;
+        }
+    }
+    return total;
+}
 
-    // With pull-up bias: ACTIVE = HIGH (not pressed), INACTIVE = LOW (pressed/grounded)
-    // Our button logic expects: 0 = pressed, 1 = not pressed
-    return value == GPIOD_LINE_VALUE_ACTIVE ? 1 : 0;
+void wakeEdgeWait() {
+    if (wakeFd >= 0) {
+        uint64_t one = 1;
+        ssize_t unused = write(wakeFd, &one, sizeof(one));
+        (void)unused;
+    }
 }
 
 #elif defined(HAVE_PIGPIO)
 
+bool gpioInitialized = false;
+int wakeFd = -1;  // eventfd signalled per alert and by wakeEdgeWait()
+
+// Alerts from pigpio's callback thread to the input thread, packed as
+// (gpio << 1) | level. pigpio runs every alert function on one thread, so
+// this stays single-producer.
+constexpr size_t ALERT_QUEUE_CAPACITY = 256;
+std::unique_ptr<RingBuffer<uint32_t>> alertEvents;
+std::atomic<bool> alertOverflow{false};
+
+// Line levels, one bit per GPIO (1 = high), seeded at init and then kept
+// current from alerts so a device sees the level of the edge that woke it.
+// Only touched by the thread that calls waitForEdges().
+uint32_t levelShadow = ~0u;
+
+void onAlert(int gpio, int level, uint32_t tick) {
+    (void)tick;
+    if (level > 1) return;  // Watchdog timeout, not an edge
+    uint32_t event = (static_cast<uint32_t>(gpio) << 1) | static_cast<uint32_t>(level);
+    if (!alertEvents->write(&event, 1)) {
+        alertOverflow.store(true);
+    }
+    uint64_t one = 1;
+    ssize_t unused = write(wakeFd, &one, sizeof(one));
+    (void)unused;
+}
+
+void setupAlertLine(unsigned int pin, unsigned int steadyUs) {
+    gpioSetMode(pin, PI_INPUT);
+    gpioSetPullUpDown(pin, PI_PUD_UP);
+    gpioGlitchFilter(pin, steadyUs);
+}
+
 bool initPlatformGPIO() {
-    if (!gpioInitialized) {
-        if (gpioInitialise() < 0) {
-            std::cerr << "Failed to initialize pigpio" << std::endl;
-            return false;
-        }
-        gpioInitialized = true;
+    if (gpioInitialized) return true;
+    
+    if (gpioInitialise() < 0) {
+        std::cerr << "Failed to initialize pigpio" << std::endl;
+        return false;
+    }
+    wakeFd = eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC);
+    if (wakeFd < 0) {
+        std::cerr << "Failed to create GPIO wake eventfd" << std::endl;
+        gpioTerminate();
+        return false;
+    }
+    alertEvents = std::make_unique<RingBuffer<uint32_t>>(ALERT_QUEUE_CAPACITY);
+    
+    for (size_t i = 0; i < NUM_ENCODER_LINES; ++i) {
+        setupAlertLine(ENCODER_LINES[i], ENCODER_DEBOUNCE_US);
+    }
+    for (size_t i = 0; i < NUM_SWITCH_LINES; ++i) {
+        setupAlertLine(SWITCH_LINES[i], SWITCH_DEBOUNCE_US);
+    }
+    levelShadow = gpioRead_Bits_0_31();
+    
+    // Alerts go live last, once the queue and shadow they feed exist
+    for (size_t i = 0; i < NUM_ENCODER_LINES; ++i) {
+        gpioSetAlertFunc(ENCODER_LINES[i], onAlert);
+    }
+    for (size_t i = 0; i < NUM_SWITCH_LINES; ++i) {
+        gpioSetAlertFunc(SWITCH_LINES[i], onAlert);
     }
+    
+    gpioInitialized = true;
     return true;
 }
 
 void cleanupPlatformGPIO() {
     if (gpioInitialized) {
+        // Terminating stops the alert thread before the queue goes away
         gpioTerminate();
         gpioInitialized = false;
     }
+    alertEvents.reset();
+    if (wakeFd >= 0) {
+        close(wakeFd);
+        wakeFd = -1;
+    }
 }
 
-int readPin(int pin) {
-    return gpioRead(pin);
+uint32_t readLevels() {
+    return levelShadow;
 }
 
 void setupInputPin(int pin) {
-    gpioSetMode(pin, PI_INPUT);
-    gpioSetPullUpDown(pin, PI_PUD_UP);
+    // Mode, pull-up and glitch filter are set for every line in
+    // initPlatformGPIO(), ahead of the alert functions
+    (void)pin;
+}
+
+// Same contract as the libgpiod version: block until an alert arrives,
+// wakeEdgeWait() is called, or the timeout expires (negative = wait
+// indefinitely), then apply every queued alert to the level shadow and
+// call onEdge(lineBit, levels) after each one. If the queue overflowed the
+// shadow is resynced from the level register and reported as all lines
+// changed.
+template<typename OnEdge>
+int waitForEdges(int64_t timeoutNs, OnEdge&& onEdge) {
+    if (!alertEvents || wakeFd < 0) return -1;
+    
+    struct pollfd fd = {wakeFd, POLLIN, 0};
+    struct timespec timeout = {
+        static_cast<time_t>(timeoutNs / 1000000000),
+        static_cast<long>(timeoutNs % 1000000000)
+    };
+    int ret = ppoll(&fd, 1, timeoutNs < 0 ? nullptr : &timeout, nullptr);
+    if (ret < 0) return errno == EINTR ? 0 : -1;
+    
+    if (fd.revents & POLLIN) {
+        uint64_t count;
+        ssize_t unused = read(wakeFd, &count, sizeof(count));
+        (void)unused;
+    }
+    
+    int total = 0;
+    uint32_t event;
+    while (alertEvents->read(&event, 1)) {
+        uint32_t bit = 1u << (event >> 1);
+        if (event & 1u) {
+            levelShadow |= bit;
+        } else {
+            levelShadow &= ~bit;
+        }
+        onEdge(bit, levelShadow);
+        ++total;
+    }
+    if (alertOverflow.exchange(false)) {
+        levelShadow = gpioRead_Bits_0_31();
+        onEdge(~0u, levelShadow);
+    }
+    return total;
+}
+
+void wakeEdgeWait() {
+    if (wakeFd >= 0) {
+        uint64_t one = 1;
+        ssize_t unused = write(wakeFd, &one, sizeof(one));
+        (void)unused;
+    }
 }
 
 #else
@@ -152,15 +429,27 @@ bool initPlatformGPIO() {
 void cleanupPlatformGPIO() {
 }
 
-int readPin(int pin) {
-    (void)pin;
-    return 1;  // Simulated: pulled up (not pressed)
+uint32_t readLevels() {
+    return ~0u;  // Simulated: everything pulled up (not pressed)
 }
 
 void setupInputPin(int pin) {
     (void)pin;
 }
 
+// No edge events here: the input thread polls every line at the encoder
+// sampling rate, whatever timeout it asks for
+template<typename OnEdge>
+int waitForEdges(int64_t timeoutNs, OnEdge&& onEdge) {
+    (void)timeoutNs;
+    std::this_thread::sleep_for(POLLED_INPUT_INTERVAL);
+    onEdge(~0u, readLevels());  // No edge information: treat every line as changed
+    return 0;
+}
+
+void wakeEdgeWait() {
+}
+
 #endif
 
 } // anonymous namespace
@@ -169,77 +458,77 @@ void setupInputPin(int pin) {
 // RotaryEncoder Implementation
 // ============================================================================
 
-RotaryEncoder::RotaryEncoder(int clkPin, int dtPin, Callback callback)
+namespace {
+
+// Quadrature transition table indexed by (previous state << 2) | current
+// state, where state = (CLK << 1) | DT. Valid Gray-code transitions give
+// +1/-1; no change and invalid jumps (both pins changed, usually bounce or a
+// missed sample) give 0 instead of being miscounted.
+constexpr int8_t QUADRATURE_TABLE[16] = {
+     0, -1,  1,  0,
+     1,  0,  0, -1,
+    -1,  0,  0,  1,
+     0,  1, -1,  0
+};
+
+// Valid transitions per reported step. Each detent of a full cycle produces
+// four transitions; reporting every second one keeps the original
+// one-step-per-CLK-edge sensitivity.
+constexpr int TRANSITIONS_PER_STEP = 2;
+
+} // anonymous namespace
+
+void QuadratureDecoder::reset(int clk, int dt) {
+    lastState = (clk << 1) | dt;
+    pendingSteps = 0;
+}
+
+int QuadratureDecoder::update(int clk, int dt) {
+    int state = (clk << 1) | dt;
+    pendingSteps += QUADRATURE_TABLE[(lastState << 2) | state];
+    lastState = state;
+    
+    if (pendingSteps >= TRANSITIONS_PER_STEP) {
+        pendingSteps -= TRANSITIONS_PER_STEP;
+        return 1;
+    }
+    if (pendingSteps <= -TRANSITIONS_PER_STEP) {
+        pendingSteps += TRANSITIONS_PER_STEP;
+        return -1;
+    }
+    return 0;
+}
+
+RotaryEncoder::RotaryEncoder(int clkPin, int dtPin)
     : clkPin(clkPin)
     , dtPin(dtPin)
-    , callback(std::move(callback))
     , position(0)
-    , running(false)
-    , lastClk(1)
-    , lastDt(1)
 {
 }
 
-RotaryEncoder::~RotaryEncoder() {
-    stop();
-}
-
 void RotaryEncoder::start() {
-    if (running.load()) return;
-    
-#ifdef HAVE_PIGPIO
     setupInputPin(clkPin);
     setupInputPin(dtPin);
-    lastClk = readPin(clkPin);
-    lastDt = readPin(dtPin);
-#endif
-    
-    running.store(true);
-    pollThread = std::thread(&RotaryEncoder::pollLoop, this);
-}
-
-void RotaryEncoder::stop() {
-    running.store(false);
-    if (pollThread.joinable()) {
-        pollThread.join();
-    }
-}
-
-void RotaryEncoder::pollLoop() {
-    while (running.load()) {
-        update();
-        std::this_thread::sleep_for(std::chrono::milliseconds(1));
-    }
+    uint32_t levels = readLevels();
+    decoder.reset((levels >> clkPin) & 1, (levels >> dtPin) & 1);
 }
 
-void RotaryEncoder::update() {
-    int clkState = readPin(clkPin);
-    int dtState = readPin(dtPin);
+int RotaryEncoder::poll(uint32_t levels) {
+    int clkState = (levels >> clkPin) & 1;
+    int dtState = (levels >> dtPin) & 1;
     
 #if DEBUG_INPUTS
     // Log only when state changes to avoid spam
-    if (clkState != lastClk || dtState != lastDt) {
+    if (((clkState << 1) | dtState) != decoder.getState()) {
         std::cout << "[ENC " << clkPin << "/" << dtPin << "] CLK=" << clkState << " DT=" << dtState << std::endl;
     }
 #endif
     
-    if (clkState != lastClk) {
-        int direction;
-        if (dtState != clkState) {
-            position.fetch_add(1);
-            direction = 1;
-        } else {
-            position.fetch_sub(1);
-            direction = -1;
-        }
-        
-        if (callback) {
-            callback(direction);
-        }
+    int direction = decoder.update(clkState, dtState);
+    if (direction != 0) {
+        position.fetch_add(direction);
     }
-    
-    lastClk = clkState;
-    lastDt = dtState;
+    return direction;
 }
 
 // ============================================================================
@@ -251,83 +540,58 @@ MomentarySwitch::MomentarySwitch(int pin, PressCallback onPress, ReleaseCallback
     , pressCallback(std::move(onPress))
     , releaseCallback(std::move(onRelease))
     , pressed(false)
-    , running(false)
     , lastState(1)
+    , lastLoggedState(-1)
 {
     lastChange = std::chrono::steady_clock::now();
     lastPressTime = lastChange;
 }
 
-MomentarySwitch::~MomentarySwitch() {
-    stop();
-}
-
 void MomentarySwitch::start() {
-    if (running.load()) return;
-    
-#ifdef HAVE_PIGPIO
     setupInputPin(pin);
-    lastState = readPin(pin);
-#endif
-    
-    running.store(true);
-    pollThread = std::thread(&MomentarySwitch::pollLoop, this);
+    lastState = (readLevels() >> pin) & 1;
 }
 
-void MomentarySwitch::stop() {
-    running.store(false);
-    if (pollThread.joinable()) {
-        pollThread.join();
-    }
-}
-
-void MomentarySwitch::pollLoop() {
-    int lastLoggedState = -1;  // For debug logging
+bool MomentarySwitch::poll(uint32_t levels) {
+    int state = (levels >> pin) & 1;
+    auto now = std::chrono::steady_clock::now();
     
-    while (running.load()) {
-        int state = readPin(pin);
-        auto now = std::chrono::steady_clock::now();
-        
 #if DEBUG_INPUTS
-        if (state != lastLoggedState) {
-            std::cout << "[BTN " << pin << "] state=" << state 
-                      << (state == 0 ? " (PRESSED)" : " (released)") << std::endl;
-            lastLoggedState = state;
-        }
+    if (state != lastLoggedState) {
+        std::cout << "[BTN " << pin << "] state=" << state 
+                  << (state == 0 ? " (PRESSED)" : " (released)") << std::endl;
+        lastLoggedState = state;
+    }
 #endif
-        
-        // Debounce
-        if (state != lastState) {
-            lastState = state;
-            lastChange = now;
+    
+    // Debounce
+    if (state != lastState) {
+        lastState = state;
+        lastChange = now;
+    }
+    
+    if (now - lastChange < DEBOUNCE_TIME) {
+        return true;
+    }
+    
+    // Button is active low (pressed when pin reads 0)
+    if (state == 0 && !pressed.load()) {
+        pressed.store(true);
+        lastPressTime = now;
+        if (pressCallback) {
+            pressCallback();
         }
-        
-        auto elapsed = std::chrono::duration_cast<std::chrono::milliseconds>(now - lastChange).count();
-        if (elapsed < DEBOUNCE_MS) {
-            std::this_thread::sleep_for(std::chrono::milliseconds(2));
-            continue;
+    } else if (state == 1 && pressed.load()) {
+        // Enforce minimum press duration
+        if (now - lastPressTime < MIN_PRESS_TIME) {
+            return true;
         }
-        
-        // Button is active low (pressed when pin reads 0)
-        if (state == 0 && !pressed.load()) {
-            pressed.store(true);
-            lastPressTime = now;
-            if (pressCallback) {
-                pressCallback();
-            }
-        } else if (state == 1 && pressed.load()) {
-            // Enforce minimum press duration
-            auto pressDuration = std::chrono::duration_cast<std::chrono::milliseconds>(now - lastPressTime).count();
-            if (pressDuration >= MIN_PRESS_MS) {
-                pressed.store(false);
-                if (releaseCallback) {
-                    releaseCallback();
-                }
-            }
+        pressed.store(false);
+        if (releaseCallback) {
+            releaseCallback();
         }
-        
-        std::this_thread::sleep_for(std::chrono::milliseconds(2));
     }
+    return false;
 }
 
 // ============================================================================
@@ -339,45 +603,26 @@ ThreePositionSwitch::ThreePositionSwitch(int upPin, int downPin, PositionCallbac
     , downPin(downPin)
     , callback(std::move(onChange))
     , position(SwitchPosition::Off)
-    , running(false)
     , lastPosition(SwitchPosition::Off)
 {
     lastChange = std::chrono::steady_clock::now();
 }
 
-ThreePositionSwitch::~ThreePositionSwitch() {
-    stop();
-}
-
 void ThreePositionSwitch::start() {
-    if (running.load()) return;
-    
-#ifdef HAVE_PIGPIO
     setupInputPin(upPin);
     setupInputPin(downPin);
-#endif
     
     // Read initial position
-    lastPosition = readPosition();
+    lastPosition = readPosition(readLevels());
     position.store(lastPosition);
-    
-    running.store(true);
-    pollThread = std::thread(&ThreePositionSwitch::pollLoop, this);
-}
-
-void ThreePositionSwitch::stop() {
-    running.store(false);
-    if (pollThread.joinable()) {
-        pollThread.join();
-    }
 }
 
-SwitchPosition ThreePositionSwitch::readPosition() {
+SwitchPosition ThreePositionSwitch::readPosition(uint32_t levels) {
     // With pull-ups enabled:
     // - Pin reads LOW (0) when connected to GND (switch in that position)
     // - Pin reads HIGH (1) when not connected (switch in other position)
-    int upState = readPin(upPin);
-    int downState = readPin(downPin);
+    int upState = (levels >> upPin) & 1;
+    int downState = (levels >> downPin) & 1;
     
 #if DEBUG_INPUTS
     static int lastLoggedUp = -1, lastLoggedDown = -1;
@@ -399,30 +644,28 @@ SwitchPosition ThreePositionSwitch::readPosition() {
     return SwitchPosition::Off;
 }
 
-void ThreePositionSwitch::pollLoop() {
-    while (running.load()) {
-        SwitchPosition currentPos = readPosition();
-        auto now = std::chrono::steady_clock::now();
-        
-        // Debounce
-        if (currentPos != lastPosition) {
-            lastPosition = currentPos;
-            lastChange = now;
-        }
-        
-        auto elapsed = std::chrono::duration_cast<std::chrono::milliseconds>(now - lastChange).count();
-        if (elapsed >= DEBOUNCE_MS) {
-            SwitchPosition storedPos = position.load();
-            if (currentPos != storedPos) {
-                position.store(currentPos);
-                if (callback) {
-                    callback(currentPos);
-                }
-            }
+bool ThreePositionSwitch::poll(uint32_t levels) {
+    SwitchPosition currentPos = readPosition(levels);
+    auto now = std::chrono::steady_clock::now();
+    
+    // Debounce
+    if (currentPos != lastPosition) {
+        lastPosition = currentPos;
+        lastChange = now;
+    }
+    
+    if (now - lastChange < DEBOUNCE_TIME) {
+        return true;
+    }
+    
+    SwitchPosition storedPos = position.load();
+    if (currentPos != storedPos) {
+        position.store(currentPos);
+        if (callback) {
+            callback(currentPos);
         }
-        
-        std::this_thread::sleep_for(std::chrono::milliseconds(5));
     }
+    return false;
 }
 
 // ============================================================================
@@ -436,6 +679,7 @@ GPIOController::GPIOController(AudioEngine& engine, ShutdownCallback shutdownCb)
     , currentBank(Bank::A)
     , shiftPressed(false)
     , secretMode(SecretMode::None)
+    , logger(NUM_LOG_PRODUCERS)
     // secretModePreset and lastPitchEnvPosition are initialized via brace-init in header
 {
 }
@@ -461,19 +705,10 @@ void GPIOController::start() {
     
     if (hasGPIO) {
         // Create encoders
-        const int encoderPins[5][2] = {
-            {GPIO::ENCODER_1_CLK, GPIO::ENCODER_1_DT},
-            {GPIO::ENCODER_2_CLK, GPIO::ENCODER_2_DT},
-            {GPIO::ENCODER_3_CLK, GPIO::ENCODER_3_DT},
-            {GPIO::ENCODER_4_CLK, GPIO::ENCODER_4_DT},
-            {GPIO::ENCODER_5_CLK, GPIO::ENCODER_5_DT}
-        };
+        const auto& encoderPins = GPIO::ENCODER_PINS;
         
         for (int i = 0; i < 5; ++i) {
-            encoders[i] = std::make_unique<RotaryEncoder>(
-                encoderPins[i][0], encoderPins[i][1],
-                [this, i](int dir) { handleEncoder(i, dir); }
-            );
+            encoders[i] = std::make_unique<RotaryEncoder>(encoderPins[i][0], encoderPins[i][1]);
             encoders[i]->start();
             std::cout << "  ✓ encoder_" << (i+1) << " initialized (GPIO " 
                       << encoderPins[i][0] << ", " << encoderPins[i][1] << ")" << std::endl;
@@ -482,23 +717,23 @@ void GPIOController::start() {
         // Create buttons
         buttons[0] = std::make_unique<MomentarySwitch>(
             GPIO::TRIGGER_BTN,
-            [this]() { onTriggerPress(); },
-            [this]() { onTriggerRelease(); }
+            [this]() { postControlEvent(ControlAction::TriggerPress); },
+            [this]() { postControlEvent(ControlAction::TriggerRelease); }
         );
         buttons[0]->start();
         std::cout << "  ✓ trigger button initialized (GPIO " << GPIO::TRIGGER_BTN << ")" << std::endl;
         
         buttons[1] = std::make_unique<MomentarySwitch>(
             GPIO::SHIFT_BTN,
-            [this]() { onShiftPress(); },
-            [this]() { onShiftRelease(); }
+            [this]() { postControlEvent(ControlAction::ShiftPress); },
+            [this]() { postControlEvent(ControlAction::ShiftRelease); }
         );
         buttons[1]->start();
         std::cout << "  ✓ shift button initialized (GPIO " << GPIO::SHIFT_BTN << ")" << std::endl;
         
         buttons[2] = std::make_unique<MomentarySwitch>(
             GPIO::SHUTDOWN_BTN,
-            [this]() { onShutdownPress(); },
+            [this]() { postControlEvent(ControlAction::ShutdownPress); },
             nullptr
         );
         buttons[2]->start();
@@ -507,7 +742,7 @@ void GPIOController::start() {
         // Create 3-position pitch envelope switch
         pitchEnvSwitch = std::make_unique<ThreePositionSwitch>(
             GPIO::PITCH_ENV_UP, GPIO::PITCH_ENV_DOWN,
-            [this](SwitchPosition pos) { onPitchEnvChange(pos); }
+            [this](SwitchPosition pos) { postControlEvent(ControlAction::PitchEnvChange, pos); }
         );
         pitchEnvSwitch->start();
         std::cout << "  ✓ pitch_env switch initialized (GPIO " << GPIO::PITCH_ENV_UP 
@@ -528,25 +763,18 @@ void GPIOController::start() {
     }
     
     // Apply initial parameters (Auto Wail preset)
-    engine.setVolume(params.volume);
-    engine.setLfoDepth(params.lfoDepth);        // Filter modulation depth
-    engine.setLfoPitchDepth(0.5f);              // Auto Wail pitch modulation (wee-woo)
-    engine.setLfoRate(params.lfoRate);
-    engine.setLfoWaveform(Waveform::Triangle);  // Smooth pitch transitions
-    engine.setFilterCutoff(params.filterFreq);
-    engine.setFrequency(params.baseFreq);
-    engine.setFilterResonance(params.filterRes);
-    engine.setDelayFeedback(params.delayFeedback);
-    engine.setReverbMix(params.reverbMix);
-    engine.setReleaseTime(params.release);
-    engine.setDelayTime(params.delayTime);
-    engine.setReverbSize(params.reverbSize);
-    engine.setWaveform(params.oscWaveform);
+    applyDefaultParameters();
 
     std::cout << "  Initial LFO: depth=" << params.lfoDepth << ", rate=" << params.lfoRate << "Hz" << std::endl;
     
     running.store(true);
     
+    if (hasGPIO) {
+        logger.start();
+        controlThread = std::thread(&GPIOController::controlLoop, this);
+        inputThread = std::thread(&GPIOController::inputLoop, this);
+    }
+    
     // Start LED controller and show ready color
     if (ledController) {
         ledController->start();
@@ -573,15 +801,19 @@ void GPIOController::stop() {
     
     running.store(false);
     
-    for (auto& encoder : encoders) {
-        if (encoder) encoder->stop();
+    wakeEdgeWait();
+    if (inputThread.joinable()) {
+        inputThread.join();
     }
     
-    for (auto& button : buttons) {
-        if (button) button->stop();
+    {
+        std::lock_guard<std::mutex> lock(controlMutex);
     }
-    
-    if (pitchEnvSwitch) pitchEnvSwitch->stop();
+    controlCv.notify_one();
+    if (controlThread.joinable()) {
+        controlThread.join();
+    }
+    logger.stop();
     
     if (ledController) ledController->stop();
     
@@ -590,98 +822,212 @@ void GPIOController::stop() {
     std::cout << "Control surface stopped" << std::endl;
 }
 
-void GPIOController::handleEncoder(int encoderIndex, int direction) {
-    Bank bank = currentBank.load();
-
-    // Bank A parameters
-    const char* bankAParams[] = {"lfo_depth", "base_freq", "filter_freq", "delay_feedback", "reverb_mix"};
-    // Bank B parameters
-    const char* bankBParams[] = {"lfo_rate", "delay_time", "filter_res", "osc_waveform", "reverb_size"};
+void GPIOController::inputLoop() {
+    // Follow-up poll interval while a switch is debouncing; otherwise the
+    // thread sleeps until an edge arrives or stop() wakes it
+    constexpr int64_t SETTLE_POLL_NS = 2000000;   // 2 ms
+    constexpr int64_t IDLE_WAIT_NS = -1;
     
-    const char* paramName = (bank == Bank::A) ? bankAParams[encoderIndex] : bankBParams[encoderIndex];
+    setCurrentThreadRealtime(inputPriority, "GPIO input");
+    if (inputCore >= 0) {
+        setCurrentThreadAffinity(inputCore, "GPIO input");
+    }
     
-    // Update parameter based on type
-    float step;
-    float newValue;
+    // Level word shared by every device, kept current per edge rather than
+    // read per pin
+    uint32_t levels = readLevels();
+    bool settling = true;
+    while (running.load()) {
+        // Encoders are decoded per event: a wakeup can carry several edges
+        // for one encoder, and sampling only the final level would collapse
+        // them into an invalid jump
+        uint32_t changed = 0;
+        int ret = waitForEdges(settling ? SETTLE_POLL_NS : IDLE_WAIT_NS, [&](uint32_t lines, uint32_t lineLevels) {
+            changed |= lines;
+            levels = lineLevels;
+            for (size_t i = 0; i < encoders.size(); ++i) {
+                if (!encoders[i] || !(lines & encoders[i]->getPinMask())) continue;
+                int direction = encoders[i]->poll(levels);
+                if (direction != 0) {
+                    Bank bank = currentBank.load();
+                    const ParamSpec& spec = PARAM_SPECS[static_cast<int>(BANK_PARAMS[static_cast<int>(bank)][i])];
+                    handleEncoder(spec, bank, direction);
+                }
+            }
+        });
+        if (ret < 0) {
+            std::cerr << "GPIO edge wait failed - input thread stopping" << std::endl;
+            break;
+        }
+        
+        // Only switches whose lines had an edge need sampling, plus all of
+        // them while any is still debouncing
+        uint32_t switchLines = settling ? ~0u : changed;
+        settling = false;
+        for (auto& button : buttons) {
+            if (button && (switchLines & button->getPinMask()) && button->poll(levels)) settling = true;
+        }
+        if (pitchEnvSwitch && (switchLines & pitchEnvSwitch->getPinMask()) && pitchEnvSwitch->poll(levels)) {
+            settling = true;
+        }
+    }
+}
+
+const GPIOController::ParamSpec GPIOController::PARAM_SPECS[] = {
+    // Logarithmic entries cover the full range in about one rotation (24 steps)
+    {"lfo_depth",      ParamKind::Linear,   0.042f, 0.0f,   1.0f,     &Parameters::lfoDepth,      &AudioEngine::setLfoDepth},
+    {"base_freq",      ParamKind::Log,      1.165f, 50.0f,  2000.0f,  &Parameters::baseFreq,      &AudioEngine::setFrequency},
+    {"filter_freq",    ParamKind::Log,      1.32f,  20.0f,  20000.0f, &Parameters::filterFreq,    &AudioEngine::setFilterCutoff},
+    {"delay_feedback", ParamKind::Linear,   0.04f,  0.0f,   0.95f,    &Parameters::delayFeedback, &AudioEngine::setDelayFeedback},
+    {"reverb_mix",     ParamKind::Linear,   0.042f, 0.0f,   1.0f,     &Parameters::reverbMix,     &AudioEngine::setReverbMix},
+    {"lfo_rate",       ParamKind::Log,      1.15f,  0.1f,   20.0f,    &Parameters::lfoRate,       &AudioEngine::setLfoRate},
+    {"delay_time",     ParamKind::Linear,   0.083f, 0.001f, 2.0f,     &Parameters::delayTime,     &AudioEngine::setDelayTime},
+    {"filter_res",     ParamKind::Linear,   0.04f,  0.0f,   0.95f,    &Parameters::filterRes,     &AudioEngine::setFilterResonance},
+    {"osc_waveform",   ParamKind::Waveform, 1.0f,   0.0f,   3.0f,     nullptr,                    nullptr},
+    {"reverb_size",    ParamKind::Linear,   0.042f, 0.0f,   1.0f,     &Parameters::reverbSize,    &AudioEngine::setReverbSize},
+};
 
-    if (strcmp(paramName, "lfo_depth") == 0) {
-        step = 0.042f * direction;
-        params.lfoDepth = clamp(params.lfoDepth + step, 0.0f, 1.0f);
-        engine.setLfoDepth(params.lfoDepth);  // Filter modulation depth
-        newValue = params.lfoDepth;
-    }
-    else if (strcmp(paramName, "filter_freq") == 0) {
-        // Logarithmic control for full range in ~1 rotation (24 steps)
-        float multiplier = (direction > 0) ? 1.32f : (1.0f / 1.32f);
-        params.filterFreq = clamp(params.filterFreq * multiplier, 20.0f, 20000.0f);
-        engine.setFilterCutoff(params.filterFreq);
-        newValue = params.filterFreq;
-    }
-    else if (strcmp(paramName, "base_freq") == 0) {
-        // Logarithmic frequency control for full range in ~1 rotation (24 steps)
-        float multiplier = (direction > 0) ? 1.165f : (1.0f / 1.165f);
-        params.baseFreq = clamp(params.baseFreq * multiplier, 50.0f, 2000.0f);
-        engine.setFrequency(params.baseFreq);
+const GPIOController::Param GPIOController::BANK_PARAMS[2][5] = {
+    {Param::LfoDepth, Param::BaseFreq, Param::FilterFreq, Param::DelayFeedback, Param::ReverbMix},
+    {Param::LfoRate, Param::DelayTime, Param::FilterRes, Param::OscWaveform, Param::ReverbSize}
+};
 
+void GPIOController::handleEncoder(const ParamSpec& spec, Bank bank, int direction) {
+    float newValue;
+    {
+        // Presets and the secret-mode restore rewrite params from the control thread
+        std::lock_guard<std::mutex> lock(paramsMutex);
+        if (spec.kind == ParamKind::Waveform) {
+            params.oscWaveform = (params.oscWaveform + direction + NUM_WAVEFORMS) % NUM_WAVEFORMS;
+            newValue = static_cast<float>(params.oscWaveform);
+        } else {
+            float& value = params.*spec.value;
+            if (spec.kind == ParamKind::Log) {
+                float multiplier = (direction > 0) ? spec.step : (1.0f / spec.step);
+                newValue = clamp(value * multiplier, spec.minValue, spec.maxValue);
+            } else {
+                newValue = clamp(value + spec.step * direction, spec.minValue, spec.maxValue);
+            }
+        
+            // Turning past either end of the range changes nothing downstream
+            if (newValue == value) {
+                return;
+            }
+            value = newValue;
+        }
+        queueParameter(spec, newValue);
+        
         // Only modulate delay time inversely with pitch in PitchDelay secret mode
         // (higher pitch = shorter delay - creates harmonic echo patterns common in dub sirens)
-        if (secretMode.load() == SecretMode::PitchDelay) {
+        if (spec.value == &Parameters::baseFreq && secretMode.load() == SecretMode::PitchDelay) {
             float refFreq = 440.0f;
             float scaledDelayTime = params.delayTime * (refFreq / params.baseFreq);
             scaledDelayTime = clamp(scaledDelayTime, 0.01f, 2.0f);
-            engine.setDelayTime(scaledDelayTime);
+            // Coalesced like any other encoder change rather than hitting the
+            // engine on every detent
+            queueParameter(PARAM_SPECS[static_cast<int>(Param::DelayTime)], scaledDelayTime);
         }
-
-        newValue = params.baseFreq;
-    }
-    else if (strcmp(paramName, "filter_res") == 0) {
-        step = 0.04f * direction;
-        params.filterRes = clamp(params.filterRes + step, 0.0f, 0.95f);
-        engine.setFilterResonance(params.filterRes);
-        newValue = params.filterRes;
-    }
-    else if (strcmp(paramName, "delay_feedback") == 0) {
-        step = 0.04f * direction;
-        params.delayFeedback = clamp(params.delayFeedback + step, 0.0f, 0.95f);
-        engine.setDelayFeedback(params.delayFeedback);
-        newValue = params.delayFeedback;
-    }
-    else if (strcmp(paramName, "reverb_mix") == 0) {
-        step = 0.042f * direction;
-        params.reverbMix = clamp(params.reverbMix + step, 0.0f, 1.0f);
-        engine.setReverbMix(params.reverbMix);
-        newValue = params.reverbMix;
-    }
-    else if (strcmp(paramName, "lfo_rate") == 0) {
-        // Logarithmic control for LFO rate (0.1 Hz to 20 Hz)
-        float multiplier = (direction > 0) ? 1.15f : (1.0f / 1.15f);
-        params.lfoRate = clamp(params.lfoRate * multiplier, 0.1f, 20.0f);
-        engine.setLfoRate(params.lfoRate);
-        newValue = params.lfoRate;
-    }
-    else if (strcmp(paramName, "delay_time") == 0) {
-        step = 0.083f * direction;
-        params.delayTime = clamp(params.delayTime + step, 0.001f, 2.0f);
-        engine.setDelayTime(params.delayTime);
-        newValue = params.delayTime;
-    }
-    else if (strcmp(paramName, "reverb_size") == 0) {
-        step = 0.042f * direction;
-        params.reverbSize = clamp(params.reverbSize + step, 0.0f, 1.0f);
-        engine.setReverbSize(params.reverbSize);
-        newValue = params.reverbSize;
-    }
-    else if (strcmp(paramName, "osc_waveform") == 0) {
-        params.oscWaveform = (params.oscWaveform + direction + 4) % 4;
-        engine.setWaveform(params.oscWaveform);
-        newValue = static_cast<float>(params.oscWaveform);
-    }
-    else {
+    }
+    
+    // Nothing is formatted unless this tick is actually printed
+    auto now = std::chrono::steady_clock::now();
+    if (now - lastEncoderLog < ENCODER_LOG_INTERVAL) {
         return;
     }
+    lastEncoderLog = now;
+    
+    // Printed later on the logger thread so the input thread never blocks on stdout
+    LogEvent event;
+    event.format = (spec.kind == ParamKind::Waveform) ? formatWaveformChange : formatParamChange;
+    event.text = spec.name;
+    event.code = static_cast<int>(bank);
+    event.values[0] = newValue;
+    logger.post(LOG_INPUT, event);
+}
+
+void GPIOController::queueParameter(const ParamSpec& spec, float value) {
+    size_t index = static_cast<size_t>(&spec - PARAM_SPECS);
+    pendingValues[index].store(value, std::memory_order_relaxed);
+    
+    // Only the first change since the last flush needs to wake the control thread
+    if (dirtyParams.fetch_or(1u << index) == 0) {
+        {
+            std::lock_guard<std::mutex> lock(controlMutex);
+        }
+        controlCv.notify_one();
+    }
+}
+
+void GPIOController::flushParameters() {
+    uint32_t dirty = dirtyParams.exchange(0);
+    for (size_t i = 0; dirty != 0; ++i, dirty >>= 1) {
+        if (!(dirty & 1u)) continue;
+        
+        const ParamSpec& spec = PARAM_SPECS[i];
+        float value = pendingValues[i].load(std::memory_order_relaxed);
+        if (spec.kind == ParamKind::Waveform) {
+            engine.setWaveform(static_cast<int>(value));
+        } else {
+            (engine.*spec.setter)(value);
+        }
+    }
+}
+
+void GPIOController::postControlEvent(ControlAction action, SwitchPosition position) {
+    {
+        std::lock_guard<std::mutex> lock(controlMutex);
+        controlEvents.push_back({action, position});
+    }
+    controlCv.notify_one();
+}
+
+void GPIOController::dispatchControlEvent(const ControlEvent& event) {
+    switch (event.action) {
+        case ControlAction::TriggerPress:   onTriggerPress(); break;
+        case ControlAction::TriggerRelease: onTriggerRelease(); break;
+        case ControlAction::ShiftPress:     onShiftPress(); break;
+        case ControlAction::ShiftRelease:   onShiftRelease(); break;
+        case ControlAction::ShutdownPress:  onShutdownPress(); break;
+        case ControlAction::PitchEnvChange: onPitchEnvChange(event.position); break;
+    }
+}
+
+void GPIOController::controlLoop() {
+    auto nextFlush = std::chrono::steady_clock::now();
+    std::unique_lock<std::mutex> lock(controlMutex);
     
-    const char* bankName = (bank == Bank::A) ? "A" : "B";
-    std::cout << "[Bank " << bankName << "] " << paramName << ": " << newValue << std::endl;
+    while (running.load()) {
+        if (controlEvents.empty()) {
+            if (dirtyParams.load() != 0) {
+                // Parameters are waiting: sleep until the flush is due unless
+                // a button event arrives first
+                controlCv.wait_until(lock, nextFlush, [this] {
+                    return !controlEvents.empty() || !running.load();
+                });
+            } else {
+                controlCv.wait(lock, [this] {
+                    return !controlEvents.empty() || dirtyParams.load() != 0 || !running.load();
+                });
+            }
+        }
+        
+        // Handlers run unlocked so input threads can keep posting
+        while (!controlEvents.empty()) {
+            ControlEvent event = controlEvents.front();
+            controlEvents.pop_front();
+            lock.unlock();
+            dispatchControlEvent(event);
+            lock.lock();
+        }
+        
+        auto now = std::chrono::steady_clock::now();
+        if (dirtyParams.load() != 0 && now >= nextFlush) {
+            lock.unlock();
+            flushParameters();
+            lock.lock();
+            nextFlush = now + PARAM_FLUSH_INTERVAL;
+        }
+    }
 }
 
 void GPIOController::onTriggerPress() {
@@ -737,10 +1083,7 @@ void GPIOController::onShiftPress() {
     shiftPressed.store(true);
 
     // Track shift button presses for secret mode activation
-    {
-        std::lock_guard<std::mutex> lock(pressesMutex);
-        recentShiftPresses.push_back(std::chrono::steady_clock::now());
-    }
+    recentShiftPresses[shiftPressTotal++ % SHIFT_PRESS_HISTORY] = std::chrono::steady_clock::now();
     checkSecretModeActivation();
 
     SecretMode currentMode = secretMode.load();
@@ -783,8 +1126,27 @@ void GPIOController::onShutdownPress() {
         shutdownCallback();
     }
     
-    // Issue system shutdown command
-    std::system("sudo shutdown -h now");
+    // Issue system shutdown command. Spawned rather than run through
+    // std::system() so the control thread doesn't wait on it - stop() joins
+    // this thread during teardown. The child gets an empty signal mask since
+    // it would otherwise inherit SIGINT/SIGTERM blocked from main().
+    posix_spawnattr_t attr;
+    posix_spawnattr_init(&attr);
+    sigset_t noSignals;
+    sigemptyset(&noSignals);
+    posix_spawnattr_setsigmask(&attr, &noSignals);
+    posix_spawnattr_setflags(&attr, POSIX_SPAWN_SETSIGMASK);
+    
+    char* const argv[] = {
+        const_cast<char*>("sudo"), const_cast<char*>("shutdown"),
+        const_cast<char*>("-h"), const_cast<char*>("now"), nullptr
+    };
+    pid_t pid;
+    int err = posix_spawnp(&pid, "sudo", nullptr, &attr, argv, environ);
+    if (err != 0) {
+        std::cerr << "Failed to run shutdown: " << std::strerror(err) << std::endl;
+    }
+    posix_spawnattr_destroy(&attr);
 }
 
 // ============================================================================
@@ -794,46 +1156,25 @@ void GPIOController::onShutdownPress() {
 void GPIOController::checkSecretModeActivation() {
     auto now = std::chrono::steady_clock::now();
 
+    // Count recent presses within 2 second window, newest first
+    size_t stored = std::min(shiftPressTotal, SHIFT_PRESS_HISTORY);
     int pressCount = 0;
-    bool activatePitchDelay = false;
-    bool activateNJD = false;
-    bool activateUFO = false;
-
-    {
-        std::lock_guard<std::mutex> lock(pressesMutex);
-
-        // Remove old presses (older than 2 seconds)
-        recentShiftPresses.erase(
-            std::remove_if(recentShiftPresses.begin(), recentShiftPresses.end(),
-                [&now](const auto& t) {
-                    return std::chrono::duration_cast<std::chrono::milliseconds>(now - t).count() > 2000;
-                }),
-            recentShiftPresses.end()
-        );
-
-        // Count recent presses within 2 second window
-        pressCount = static_cast<int>(recentShiftPresses.size());
-
-        // Check for UFO mode first (10 presses) - takes priority
-        if (pressCount == 10) {
-            activateUFO = true;
-        }
-        // Check for NJD mode (5 presses)
-        else if (pressCount == 5) {
-            activateNJD = true;
-        }
-        // Check for Pitch-Delay mode (3 presses)
-        else if (pressCount == 3) {
-            activatePitchDelay = true;
-        }
+    while (static_cast<size_t>(pressCount) < stored) {
+        size_t slot = (shiftPressTotal - 1 - pressCount) % SHIFT_PRESS_HISTORY;
+        if (now - recentShiftPresses[slot] > std::chrono::milliseconds(2000)) break;
+        ++pressCount;
     }
 
-    // Activate outside the lock to avoid potential deadlock with other callbacks
-    if (activateUFO) {
+    // Check for UFO mode first (10 presses) - takes priority
+    if (pressCount == 10) {
         activateSecretMode(SecretMode::UFO);
-    } else if (activateNJD) {
+    }
+    // Check for NJD mode (5 presses)
+    else if (pressCount == 5) {
         activateSecretMode(SecretMode::NJD);
-    } else if (activatePitchDelay) {
+    }
+    // Check for Pitch-Delay mode (3 presses)
+    else if (pressCount == 3) {
         activateSecretMode(SecretMode::PitchDelay);
     }
 }
@@ -930,39 +1271,44 @@ void GPIOController::exitSecretMode() {
     // (PitchDelay mode doesn't change parameters, just behavior)
     if (currentMode == SecretMode::NJD || currentMode == SecretMode::UFO) {
         // Restore default parameters (Auto Wail preset)
-        params.volume = 0.6f;
-        params.lfoDepth = 0.5f;      // LFO filter modulation depth
-        params.lfoRate = 2.0f;       // 2 Hz - wee-woo every 0.5 seconds
-        params.filterFreq = 3000.0f; // Standard filter setting for siren
-        params.baseFreq = 440.0f;    // A4 - standard siren pitch
-        params.filterRes = 0.5f;     // Standard resonance
-        params.delayFeedback = 0.55f;// Spacey dub echoes
-        params.delayTime = 0.375f;   // Dotted eighth - classic dub
-        params.reverbMix = 0.4f;     // Wet for atmosphere
-        params.reverbSize = 0.7f;    // Large dub space
-        params.release = 0.5f;       // Medium release
-        params.oscWaveform = 1;      // Square for classic siren sound
-
-        // Apply restored parameters (Auto Wail preset)
-        engine.setVolume(params.volume);
-        engine.setLfoDepth(params.lfoDepth);        // Filter modulation depth
-        engine.setLfoPitchDepth(0.5f);              // Auto Wail pitch modulation (wee-woo)
-        engine.setLfoRate(params.lfoRate);
-        engine.setLfoWaveform(Waveform::Triangle);  // Smooth pitch transitions
-        engine.setFilterCutoff(params.filterFreq);
-        engine.setFrequency(params.baseFreq);
-        engine.setFilterResonance(params.filterRes);
-        engine.setDelayFeedback(params.delayFeedback);
-        engine.setDelayTime(params.delayTime);
-        engine.setReverbMix(params.reverbMix);
-        engine.setReverbSize(params.reverbSize);
-        engine.setReleaseTime(params.release);
-        engine.setWaveform(params.oscWaveform);
+        applyDefaultParameters();
 
         std::cout << "Parameters restored to defaults" << std::endl;
     }
 }
 
+void GPIOController::applyDefaultParameters() {
+    Parameters values;
+    {
+        std::lock_guard<std::mutex> lock(paramsMutex);
+        
+        // Drop encoder changes still waiting to be flushed so they can't
+        // override the restored values
+        dirtyParams.store(0);
+        params = Parameters{};
+        values = params;
+    }
+    
+    engine.setLfoPitchDepth(0.5f);              // Auto Wail pitch modulation (wee-woo)
+    engine.setLfoWaveform(Waveform::Triangle);  // Smooth pitch transitions
+    applyParameters(values);
+}
+
+void GPIOController::applyParameters(const Parameters& values) {
+    engine.setVolume(values.volume);
+    engine.setLfoDepth(values.lfoDepth);        // Filter modulation depth
+    engine.setLfoRate(values.lfoRate);
+    engine.setFilterCutoff(values.filterFreq);
+    engine.setFrequency(values.baseFreq);
+    engine.setFilterResonance(values.filterRes);
+    engine.setDelayFeedback(values.delayFeedback);
+    engine.setDelayTime(values.delayTime);
+    engine.setReverbMix(values.reverbMix);
+    engine.setReverbSize(values.reverbSize);
+    engine.setReleaseTime(values.release);
+    engine.setWaveform(values.oscWaveform);
+}
+
 void GPIOController::cycleSecretModePreset() {
     SecretMode currentMode = secretMode.load();
 
@@ -977,161 +1323,170 @@ void GPIOController::applySecretModePreset() {
     SecretMode currentMode = secretMode.load();
     int preset = secretModePreset.load();  // Load once for consistent use throughout
     
-    // Preset parameters: baseFreq, filterFreq, filterRes, release, oscWaveform, delayTime, delayFeedback, reverbSize, reverbMix
+    const char* njdPresetNames[] = {"Auto Wail", "Classic", "Alert", "Bright", "Wobble"};
+    const char* ufoPresetNames[] = {"Laser Blast", "Flying Saucer", "Alien Signal", "Warp Drive"};
     
-    if (currentMode == SecretMode::NJD) {
-        // NJD Classic Dub Siren Presets
-        // These are inspired by the classic NJD siren sounds
-        const char* presetNames[] = {"Auto Wail", "Classic", "Alert", "Bright", "Wobble"};
-
-        switch (preset) {
-            case 0: // Auto Wail - automatic pitch-alternating siren (wee-woo-wee-woo)
-                params.baseFreq = 440.0f;     // A4 - standard siren pitch
-                params.filterFreq = 3000.0f;  // Standard filter setting
-                params.filterRes = 0.5f;      // Standard resonance
-                params.release = 0.5f;        // Medium release
-                params.oscWaveform = 1;       // Square for classic siren sound
-                params.delayTime = 0.375f;    // Dotted eighth - classic dub
-                params.delayFeedback = 0.55f; // Spacey dub echoes
-                params.reverbSize = 0.7f;     // Large dub space
-                params.reverbMix = 0.4f;      // Wet for atmosphere
-                // Apply LFO pitch modulation for automatic wail
-                engine.setLfoRate(2.0f);      // 2 Hz - wee-woo every 0.5 seconds
-                engine.setLfoPitchDepth(0.5f); // ±0.5 octaves for noticeable pitch swing
-                engine.setLfoWaveform(Waveform::Triangle); // Smooth pitch transitions
-                break;
-
-            case 1: // Classic NJD - the original dub siren sound
-                params.baseFreq = 587.0f;     // D5 - classic siren note
-                params.filterFreq = 3000.0f;
-                params.filterRes = 0.5f;      // Increased for more character
-                params.release = 0.8f;
-                params.oscWaveform = 1;       // Square for more edge
-                params.delayTime = 0.375f;    // Dotted eighth for reggae feel
-                params.delayFeedback = 0.5f;  // Classic dub echoes
-                params.reverbSize = 0.65f;    // Deep dub space
-                params.reverbMix = 0.35f;
-                // Reset LFO pitch modulation (not used in this preset)
-                engine.setLfoPitchDepth(0.0f);
-                break;
-
-            case 2: // Alert - emergency siren for rapid on/off triggering
-                params.baseFreq = 440.0f;     // A4 - mid-range wail
-                params.filterFreq = 2500.0f;
-                params.filterRes = 0.4f;
-                params.release = 0.3f;        // Short for clean toggling
-                params.oscWaveform = 1;       // Square for harsh siren sound
-                params.delayTime = 0.375f;    // Dotted eighth - classic dub
-                params.delayFeedback = 0.55f; // Spacey dub echoes
-                params.reverbSize = 0.7f;     // Large dub space
-                params.reverbMix = 0.4f;      // Wet for atmosphere
-                // Reset LFO pitch modulation (not used in this preset)
-                engine.setLfoPitchDepth(0.0f);
-                break;
-
-            case 3: // Bright - cutting through the mix
-                params.baseFreq = 880.0f;     // A5 - bright and piercing
-                params.filterFreq = 6000.0f;
-                params.filterRes = 0.3f;
-                params.release = 0.5f;
-                params.oscWaveform = 1;       // Square for edge
-                params.delayTime = 0.25f;
-                params.delayFeedback = 0.55f;
-                params.reverbSize = 0.4f;
-                params.reverbMix = 0.35f;
-                // Reset LFO pitch modulation (not used in this preset)
-                engine.setLfoPitchDepth(0.0f);
-                break;
-
-            case 4: // Wobble - with heavy resonance
-                params.baseFreq = 392.0f;     // G4
-                params.filterFreq = 1500.0f;
-                params.filterRes = 0.75f;     // Heavy resonance
-                params.release = 1.0f;
-                params.oscWaveform = 2;       // Sawtooth
-                params.delayTime = 0.333f;    // Triplet feel
-                params.delayFeedback = 0.6f;
-                params.reverbSize = 0.5f;
-                params.reverbMix = 0.4f;
-                // Reset LFO pitch modulation (not used in this preset)
-                engine.setLfoPitchDepth(0.0f);
-                break;
+    // Only params is written under the lock; the engine setters and console
+    // output below run from a copy so the input thread never waits on them
+    Parameters values;
+    float lfoPitchDepth = 0.0f;
+    bool triangleLfo = false;
+    {
+        std::lock_guard<std::mutex> lock(paramsMutex);
+        
+        // Drop encoder changes still waiting to be flushed so they can't
+        // override the preset
+        dirtyParams.store(0);
+        
+        // Preset parameters: baseFreq, filterFreq, filterRes, release, oscWaveform, delayTime, delayFeedback, reverbSize, reverbMix
+        
+        if (currentMode == SecretMode::NJD) {
+            // NJD Classic Dub Siren Presets
+            // These are inspired by the classic NJD siren sounds
+            switch (preset) {
+                case 0: // Auto Wail - automatic pitch-alternating siren (wee-woo-wee-woo)
+                    params.baseFreq = 440.0f;     // A4 - standard siren pitch
+                    params.filterFreq = 3000.0f;  // Standard filter setting
+                    params.filterRes = 0.5f;      // Standard resonance
+                    params.release = 0.5f;        // Medium release
+                    params.oscWaveform = 1;       // Square for classic siren sound
+                    params.delayTime = 0.375f;    // Dotted eighth - classic dub
+                    params.delayFeedback = 0.55f; // Spacey dub echoes
+                    params.reverbSize = 0.7f;     // Large dub space
+                    params.reverbMix = 0.4f;      // Wet for atmosphere
+                    params.lfoRate = 2.0f;        // 2 Hz - wee-woo every 0.5 seconds
+                    // Apply LFO pitch modulation for automatic wail
+                    lfoPitchDepth = 0.5f;         // ±0.5 octaves for noticeable pitch swing
+                    triangleLfo = true;           // Smooth pitch transitions
+                    break;
+
+                case 1: // Classic NJD - the original dub siren sound
+                    params.baseFreq = 587.0f;     // D5 - classic siren note
+                    params.filterFreq = 3000.0f;
+                    params.filterRes = 0.5f;      // Increased for more character
+                    params.release = 0.8f;
+                    params.oscWaveform = 1;       // Square for more edge
+                    params.delayTime = 0.375f;    // Dotted eighth for reggae feel
+                    params.delayFeedback = 0.5f;  // Classic dub echoes
+                    params.reverbSize = 0.65f;    // Deep dub space
+                    params.reverbMix = 0.35f;
+                    // LFO pitch modulation stays off (not used in this preset)
+                    break;
+
+                case 2: // Alert - emergency siren for rapid on/off triggering
+                    params.baseFreq = 440.0f;     // A4 - mid-range wail
+                    params.filterFreq = 2500.0f;
+                    params.filterRes = 0.4f;
+                    params.release = 0.3f;        // Short for clean toggling
+                    params.oscWaveform = 1;       // Square for harsh siren sound
+                    params.delayTime = 0.375f;    // Dotted eighth - classic dub
+                    params.delayFeedback = 0.55f; // Spacey dub echoes
+                    params.reverbSize = 0.7f;     // Large dub space
+                    params.reverbMix = 0.4f;      // Wet for atmosphere
+                    // LFO pitch modulation stays off (not used in this preset)
+                    break;
+
+                case 3: // Bright - cutting through the mix
+                    params.baseFreq = 880.0f;     // A5 - bright and piercing
+                    params.filterFreq = 6000.0f;
+                    params.filterRes = 0.3f;
+                    params.release = 0.5f;
+                    params.oscWaveform = 1;       // Square for edge
+                    params.delayTime = 0.25f;
+                    params.delayFeedback = 0.55f;
+                    params.reverbSize = 0.4f;
+                    params.reverbMix = 0.35f;
+                    // LFO pitch modulation stays off (not used in this preset)
+                    break;
+
+                case 4: // Wobble - with heavy resonance
+                    params.baseFreq = 392.0f;     // G4
+                    params.filterFreq = 1500.0f;
+                    params.filterRes = 0.75f;     // Heavy resonance
+                    params.release = 1.0f;
+                    params.oscWaveform = 2;       // Sawtooth
+                    params.delayTime = 0.333f;    // Triplet feel
+                    params.delayFeedback = 0.6f;
+                    params.reverbSize = 0.5f;
+                    params.reverbMix = 0.4f;
+                    // LFO pitch modulation stays off (not used in this preset)
+                    break;
+            }
+        } else if (currentMode == SecretMode::UFO) {
+            // UFO Sci-Fi Presets
+            switch (preset) {
+                case 0: // Laser Blast - Star Wars style pew pew
+                    params.baseFreq = 1600.0f;    // Bright, sharp
+                    params.filterFreq = 6000.0f;  // Very bright
+                    params.filterRes = 0.3f;
+                    params.release = 0.15f;       // Very short, snappy
+                    params.oscWaveform = 1;       // Square for harsh edge
+                    params.delayTime = 0.03f;     // Very short for texture
+                    params.delayFeedback = 0.4f;  // Moderate
+                    params.reverbSize = 0.2f;     // Minimal space
+                    params.reverbMix = 0.15f;     // Dry, punchy
+                    break;
+
+                case 1: // Flying Saucer - classic UFO whoosh
+                    params.baseFreq = 1200.0f;    // High pitch
+                    params.filterFreq = 4000.0f;
+                    params.filterRes = 0.4f;
+                    params.release = 2.0f;        // Long decay
+                    params.oscWaveform = 0;       // Sine for clean tone
+                    params.delayTime = 0.1f;      // Short slapback
+                    params.delayFeedback = 0.7f;  // Lots of repeats
+                    params.reverbSize = 0.9f;     // Huge space
+                    params.reverbMix = 0.5f;
+                    break;
+
+                case 2: // Alien Signal - digital beeps
+                    params.baseFreq = 1800.0f;    // Very high
+                    params.filterFreq = 8000.0f;
+                    params.filterRes = 0.6f;
+                    params.release = 0.3f;        // Quick
+                    params.oscWaveform = 1;       // Square for digital feel
+                    params.delayTime = 0.05f;     // Very short
+                    params.delayFeedback = 0.8f;  // Heavy feedback
+                    params.reverbSize = 0.3f;
+                    params.reverbMix = 0.6f;
+                    break;
+
+                case 3: // Warp Drive - deep space rumble
+                    params.baseFreq = 80.0f;      // Sub bass
+                    params.filterFreq = 2000.0f;
+                    params.filterRes = 0.85f;     // Heavy resonance
+                    params.release = 3.0f;        // Very long
+                    params.oscWaveform = 2;       // Sawtooth for harmonics
+                    params.delayTime = 0.75f;
+                    params.delayFeedback = 0.5f;
+                    params.reverbSize = 0.95f;    // Maximum space
+                    params.reverbMix = 0.45f;
+                    break;
+            }
         }
-
-        std::cout << "[NJD MODE] Preset " << (preset + 1) << "/5: " 
-                  << presetNames[preset] << std::endl;
-                  
-    } else if (currentMode == SecretMode::UFO) {
-        // UFO Sci-Fi Presets
-        const char* presetNames[] = {"Laser Blast", "Flying Saucer", "Alien Signal", "Warp Drive"};
-
-        switch (preset) {
-            case 0: // Laser Blast - Star Wars style pew pew
-                params.baseFreq = 1600.0f;    // Bright, sharp
-                params.filterFreq = 6000.0f;  // Very bright
-                params.filterRes = 0.3f;
-                params.release = 0.15f;       // Very short, snappy
-                params.oscWaveform = 1;       // Square for harsh edge
-                params.delayTime = 0.03f;     // Very short for texture
-                params.delayFeedback = 0.4f;  // Moderate
-                params.reverbSize = 0.2f;     // Minimal space
-                params.reverbMix = 0.15f;     // Dry, punchy
-                break;
-
-            case 1: // Flying Saucer - classic UFO whoosh
-                params.baseFreq = 1200.0f;    // High pitch
-                params.filterFreq = 4000.0f;
-                params.filterRes = 0.4f;
-                params.release = 2.0f;        // Long decay
-                params.oscWaveform = 0;       // Sine for clean tone
-                params.delayTime = 0.1f;      // Short slapback
-                params.delayFeedback = 0.7f;  // Lots of repeats
-                params.reverbSize = 0.9f;     // Huge space
-                params.reverbMix = 0.5f;
-                break;
-
-            case 2: // Alien Signal - digital beeps
-                params.baseFreq = 1800.0f;    // Very high
-                params.filterFreq = 8000.0f;
-                params.filterRes = 0.6f;
-                params.release = 0.3f;        // Quick
-                params.oscWaveform = 1;       // Square for digital feel
-                params.delayTime = 0.05f;     // Very short
-                params.delayFeedback = 0.8f;  // Heavy feedback
-                params.reverbSize = 0.3f;
-                params.reverbMix = 0.6f;
-                break;
-
-            case 3: // Warp Drive - deep space rumble
-                params.baseFreq = 80.0f;      // Sub bass
-                params.filterFreq = 2000.0f;
-                params.filterRes = 0.85f;     // Heavy resonance
-                params.release = 3.0f;        // Very long
-                params.oscWaveform = 2;       // Sawtooth for harmonics
-                params.delayTime = 0.75f;
-                params.delayFeedback = 0.5f;
-                params.reverbSize = 0.95f;    // Maximum space
-                params.reverbMix = 0.45f;
-                break;
+        
+        values = params;
+    }
+    
+    if (currentMode == SecretMode::NJD) {
+        engine.setLfoPitchDepth(lfoPitchDepth);
+        if (triangleLfo) {
+            engine.setLfoWaveform(Waveform::Triangle);
         }
-
-        std::cout << "[UFO MODE] Preset " << (preset + 1) << "/4: "
-                  << presetNames[preset] << std::endl;
     }
     
     // Apply all parameters to engine (delay and reverb always active)
-    engine.setFrequency(params.baseFreq);
-    engine.setFilterCutoff(params.filterFreq);
-    engine.setFilterResonance(params.filterRes);
-    engine.setReleaseTime(params.release);
-    engine.setWaveform(params.oscWaveform);
-    engine.setDelayTime(params.delayTime);
-    engine.setDelayFeedback(params.delayFeedback);
-    engine.setReverbSize(params.reverbSize);
-    engine.setReverbMix(params.reverbMix);
+    applyParameters(values);
     
-    std::cout << "  Base: " << params.baseFreq << "Hz, Filter: " << params.filterFreq 
-              << "Hz, Release: " << params.release << "s" << std::endl;
+    if (currentMode == SecretMode::NJD) {
+        std::cout << "[NJD MODE] Preset " << (preset + 1) << "/5: " 
+                  << njdPresetNames[preset] << std::endl;
+    } else if (currentMode == SecretMode::UFO) {
+        std::cout << "[UFO MODE] Preset " << (preset + 1) << "/4: "
+                  << ufoPresetNames[preset] << std::endl;
+    }
+    std::cout << "  Base: " << values.baseFreq << "Hz, Filter: " << values.filterFreq 
+              << "Hz, Release: " << values.release << "s" << std::endl;
 }
 
 void GPIOController::updateLEDAudioLevel(float level) {
@@ -25,6 +25,7 @@ LEDController::LEDController(int pin)
     , cycleSpeed(1.0f)
     , currentPath(ColorPath::SunsetToOcean)
     , cyclePosition(0.0f)
+    , cycleResetPending(false)
     , colorOverride(false)
     , pendingReadyTransition(false)
     , ledHandle(nullptr)
@@ -174,8 +175,8 @@ void LEDController::setMode(LEDMode mode) {
     LEDMode oldMode = currentMode.exchange(mode);
     
     if (oldMode != mode) {
-        // Reset cycle position when mode changes
-        cyclePosition = 0.0f;
+        // Reset cycle position when mode changes (done by the update thread)
+        cycleResetPending.store(true);
         colorOverride.store(false);
         
         const char* modeName = "Unknown";
@@ -193,16 +194,26 @@ void LEDController::setAudioLevel(float level) {
     audioLevel.store(std::clamp(level, 0.0f, 1.0f));
 }
 
+void LEDController::setOverrideColor(const Color& color) {
+    std::lock_guard<std::mutex> lock(overrideMutex);
+    overrideColor = color;
+}
+
+Color LEDController::getOverrideColor() {
+    std::lock_guard<std::mutex> lock(overrideMutex);
+    return overrideColor;
+}
+
 void LEDController::showStartupColor() {
+    setOverrideColor(Color::Amber());
     colorOverride.store(true);
-    overrideColor = Color::Amber();
-    writeLED(overrideColor.scaled(brightness.load()));
+    writeLED(Color::Amber().scaled(brightness.load()));
 }
 
 void LEDController::showReadyColor() {
+    setOverrideColor(Color::LimeGreen());
     colorOverride.store(true);
-    overrideColor = Color::LimeGreen();
-    writeLED(overrideColor.scaled(brightness.load()));
+    writeLED(Color::LimeGreen().scaled(brightness.load()));
     
     // Schedule transition to normal mode after 2 seconds
     // This is handled in updateLoop() to avoid detached thread lifetime issues
@@ -211,13 +222,13 @@ void LEDController::showReadyColor() {
 }
 
 void LEDController::setColor(const Color& color) {
+    setOverrideColor(color);
     colorOverride.store(true);
-    overrideColor = color;
 }
 
 void LEDController::setColorWithPulse(const Color& color, float pulseIntensity) {
+    setOverrideColor(color);
     colorOverride.store(true);
-    overrideColor = color;
     audioLevel.store(pulseIntensity);
 }
 
@@ -241,6 +252,10 @@ void LEDController::updateLoop() {
         float deltaTime = std::chrono::duration<float>(now - lastUpdate).count();
         lastUpdate = now;
         
+        if (cycleResetPending.exchange(false)) {
+            cyclePosition = 0.0f;
+        }
+        
         // Check for pending ready transition (from showReadyColor)
         if (pendingReadyTransition.load() && now >= readyTransitionTime) {
             colorOverride.store(false);
@@ -306,7 +321,7 @@ void LEDController::updateLoop() {
 Color LEDController::calculateColor() {
     // Check for color override
     if (colorOverride.load()) {
-        return applyAudioPulse(overrideColor);
+        return applyAudioPulse(getOverrideColor());
     }
     
     Color baseColor;
@@ -10,9 +10,13 @@
  * Options:
  *   --sample-rate RATE    Audio sample rate (default: 48000)
  *   --buffer-size SIZE    Audio buffer size (default: 256)
+ *   --periods N           ALSA periods per device buffer (default: ~50 ms worth)
  *   --device DEVICE       ALSA audio device (default: "default")
  *   --simulate           Run in simulation mode (no hardware)
  *   --interactive        Run in interactive mode (keyboard control)
+ *   --audio-core CPU     Pin the audio threads to CPU (default: unpinned)
+ *   --input-core CPU     Pin the GPIO input thread to CPU (default: unpinned)
+ *   --rt-priority N      SCHED_FIFO priority of the audio thread (default: 85)
  *   --help               Show this help message
  */
 
@@ -20,7 +24,12 @@
 #include <csignal>
 #include <atomic>
 #include <cstring>
+#include <cerrno>
 #include <cfenv>
+#include <pthread.h>
+#include <poll.h>
+#include <signal.h>
+#include <unistd.h>
 
 #if defined(__x86_64__) || defined(__i386__)
 #include <xmmintrin.h>
@@ -30,6 +39,7 @@
 #include "Audio/AudioEngine.h"
 #include "Audio/AudioOutput.h"
 #include "Hardware/GPIOController.h"
+#include "Realtime.h"
 
 using namespace DubSiren;
 
@@ -62,6 +72,35 @@ void signalHandler(int signal) {
     g_running.store(false);
 }
 
+// Wait up to timeoutMs for the next non-blank character on stdin. Returns
+// 1 with the character in cmd, 0 on timeout or signal, -1 on EOF or error.
+// Reads go straight to the fd (not std::cin) so nothing can sit in a
+// stream buffer that poll() can't see.
+int readCommand(char& cmd, int timeoutMs) {
+    pollfd pfd{STDIN_FILENO, POLLIN, 0};
+    int ready = poll(&pfd, 1, timeoutMs);
+    if (ready < 0) {
+        return errno == EINTR ? 0 : -1;
+    }
+    if (ready == 0) {
+        return 0;
+    }
+    
+    char c;
+    ssize_t n = read(STDIN_FILENO, &c, 1);
+    if (n < 0) {
+        return errno == EINTR ? 0 : -1;
+    }
+    if (n == 0) {
+        return -1;
+    }
+    if (c == ' ' || c == '\t' || c == '\n' || c == '\r') {
+        return 0;
+    }
+    cmd = c;
+    return 1;
+}
+
 void printBanner() {
     std::cout << "\n";
     std::cout << "============================================================" << std::endl;
@@ -77,9 +116,13 @@ void printHelp(const char* programName) {
     std::cout << "Options:\n";
     std::cout << "  --sample-rate RATE    Audio sample rate (default: 48000)\n";
     std::cout << "  --buffer-size SIZE    Audio buffer size (default: 256)\n";
+    std::cout << "  --periods N           ALSA periods per device buffer (default: ~50 ms worth)\n";
     std::cout << "  --device DEVICE       ALSA audio device (default: \"default\")\n";
     std::cout << "  --simulate           Run in simulation mode (no hardware)\n";
     std::cout << "  --interactive        Run in interactive mode (keyboard control)\n";
+    std::cout << "  --audio-core CPU     Pin the audio threads to CPU (default: unpinned)\n";
+    std::cout << "  --input-core CPU     Pin the GPIO input thread to CPU (default: unpinned)\n";
+    std::cout << "  --rt-priority N      SCHED_FIFO priority of the audio thread (default: " << AUDIO_THREAD_PRIORITY << ")\n";
     std::cout << "  --help               Show this help message\n";
     std::cout << "\n";
 }
@@ -88,9 +131,13 @@ int main(int argc, char* argv[]) {
     // Default configuration
     int sampleRate = DEFAULT_SAMPLE_RATE;
     int bufferSize = DEFAULT_BUFFER_SIZE;
+    int periods = 0;
     const char* device = nullptr;
     bool simulate = false;
     bool interactive = false;
+    int audioCore = -1;
+    int inputCore = -1;
+    int rtPriority = AUDIO_THREAD_PRIORITY;
     
     // Parse command line arguments
     for (int i = 1; i < argc; ++i) {
@@ -104,6 +151,13 @@ int main(int argc, char* argv[]) {
         else if (strcmp(argv[i], "--buffer-size") == 0 && i + 1 < argc) {
             bufferSize = std::atoi(argv[++i]);
         }
+        else if (strcmp(argv[i], "--periods") == 0 && i + 1 < argc) {
+            periods = std::atoi(argv[++i]);
+            if (periods < 2) {
+                std::cerr << "--periods must be at least 2" << std::endl;
+                return 1;
+            }
+        }
         else if (strcmp(argv[i], "--device") == 0 && i + 1 < argc) {
             device = argv[++i];
         }
@@ -113,6 +167,19 @@ int main(int argc, char* argv[]) {
         else if (strcmp(argv[i], "--interactive") == 0) {
             interactive = true;
         }
+        else if (strcmp(argv[i], "--audio-core") == 0 && i + 1 < argc) {
+            audioCore = std::atoi(argv[++i]);
+        }
+        else if (strcmp(argv[i], "--input-core") == 0 && i + 1 < argc) {
+            inputCore = std::atoi(argv[++i]);
+        }
+        else if (strcmp(argv[i], "--rt-priority") == 0 && i + 1 < argc) {
+            rtPriority = std::atoi(argv[++i]);
+            if (rtPriority < 1 || rtPriority > 99) {
+                std::cerr << "--rt-priority must be between 1 and 99" << std::endl;
+                return 1;
+            }
+        }
         else {
             std::cerr << "Unknown option: " << argv[i] << std::endl;
             printHelp(argv[0]);
@@ -120,9 +187,21 @@ int main(int argc, char* argv[]) {
         }
     }
     
-    // Setup signal handlers
-    std::signal(SIGINT, signalHandler);
-    std::signal(SIGTERM, signalHandler);
+    // Setup signal handling. Interactive mode polls stdin, so it keeps an
+    // asynchronous handler; otherwise SIGINT/SIGTERM are blocked here, before
+    // any thread starts (threads inherit the mask), and the main thread
+    // sleeps in sigwait() until one arrives.
+    sigset_t shutdownSignals;
+    sigemptyset(&shutdownSignals);
+    sigaddset(&shutdownSignals, SIGINT);
+    sigaddset(&shutdownSignals, SIGTERM);
+    
+    if (interactive) {
+        std::signal(SIGINT, signalHandler);
+        std::signal(SIGTERM, signalHandler);
+    } else {
+        pthread_sigmask(SIG_BLOCK, &shutdownSignals, nullptr);
+    }
     
     // Enable flush-to-zero to prevent denormal CPU spikes
     enableFlushToZero();
@@ -135,8 +214,8 @@ int main(int argc, char* argv[]) {
     std::cout << "  Mode: " << (simulate ? "Simulation" : "Hardware") << std::endl;
     std::cout << "\n";
     
-    // Create audio engine
-    AudioEngine engine(sampleRate, bufferSize);
+    // Create audio engine (sized for a full render batch when driving ALSA)
+    AudioEngine engine(sampleRate, simulate ? bufferSize : bufferSize * AudioOutput::RENDER_BATCH);
     
     // Create audio output
     std::unique_ptr<AudioOutput> audioOutput;
@@ -150,6 +229,14 @@ int main(int argc, char* argv[]) {
         }
     } else {
         audioOutput = std::make_unique<AudioOutput>(engine, sampleRate, bufferSize, DEFAULT_CHANNELS, device);
+        audioOutput->setRealtimePriority(rtPriority);
+        audioOutput->setPeriods(periods);
+        audioOutput->setAudioCore(audioCore);
+        
+        // Engine and output buffers exist now; keep them (and everything
+        // the real-time threads touch later) resident
+        lockProcessMemory();
+        
         if (!audioOutput->start()) {
             std::cerr << "Failed to start audio output" << std::endl;
             std::cerr << "\nTroubleshooting:" << std::endl;
@@ -168,9 +255,12 @@ int main(int argc, char* argv[]) {
         simController = std::make_unique<SimulatedController>(engine);
         simController->start();
     } else {
-        gpioController = std::make_unique<GPIOController>(engine, [&]() {
-            g_running.store(false);
+        gpioController = std::make_unique<GPIOController>(engine, []() {
+            // Wake the main thread's sigwait()
+            kill(getpid(), SIGTERM);
         });
+        gpioController->setInputCore(inputCore);
+        gpioController->setInputPriority(relativeToAudioPriority(rtPriority, INPUT_THREAD_PRIORITY));
         gpioController->start();
     }
     
@@ -181,9 +271,18 @@ int main(int argc, char* argv[]) {
     if (interactive) {
         std::cout << "Interactive mode - press 't' to trigger, 'q' to quit" << std::endl;
         
+        // Poll stdin with a timeout so Ctrl+C is noticed without waiting
+        // for another keypress
         while (g_running.load()) {
             char cmd;
-            std::cin >> cmd;
+            int got = readCommand(cmd, 250);
+            if (got < 0) {
+                g_running.store(false);  // stdin closed
+                break;
+            }
+            if (got == 0) {
+                continue;
+            }
             
             if (simController) {
                 simController->processCommand(cmd);
@@ -196,9 +295,9 @@ int main(int argc, char* argv[]) {
     } else {
         std::cout << "Press Ctrl+C to exit" << std::endl;
         
-        while (g_running.load()) {
-            std::this_thread::sleep_for(std::chrono::milliseconds(100));
-        }
+        int sig = 0;
+        sigwait(&shutdownSignals, &sig);
+        g_running.store(false);
     }
     
     // Cleanup